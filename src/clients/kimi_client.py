@@ -4,8 +4,9 @@ OpenAI-compatible API wrapper for Moonshot AI's Kimi K2
 """
 import os
 import time
+import functools
 from openai import OpenAI
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 
 
 class KimiK2Client:
@@ -101,6 +102,92 @@ class KimiK2Client:
                 "duration": time.time() - start_time
             }
 
+    def chat_completion_stream(
+        self,
+        messages: list[Dict[str, str]],
+        temperature: float = None,
+        max_tokens: int = None,
+        timeout: float = 300.0,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a chat completion, receiving the response as a stream
+
+        Text is collected as it arrives instead of waiting for the whole
+        response body. The return value has the same shape as
+        chat_completion; usage is included only if the API sends it.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            timeout: Request timeout in seconds
+            on_text: Optional callback invoked with each text chunk
+
+        Returns:
+            Dictionary with response data
+        """
+        start_time = time.time()
+
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature or self.default_temperature,
+                max_tokens=max_tokens or self.default_max_tokens,
+                timeout=timeout,
+                stream=True
+            )
+
+            chunks = []
+            reasoning_chunks = []
+            finish_reason = None
+            usage = None
+            model = self.model
+
+            for event in stream:
+                model = event.model or model
+                if getattr(event, 'usage', None):
+                    usage = {
+                        "prompt_tokens": event.usage.prompt_tokens,
+                        "completion_tokens": event.usage.completion_tokens,
+                        "total_tokens": event.usage.total_tokens
+                    }
+                if not event.choices:
+                    continue
+
+                choice = event.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.delta.content:
+                    chunks.append(choice.delta.content)
+                    if on_text:
+                        on_text(choice.delta.content)
+                # Kimi K2 may stream thinking traces separately
+                reasoning = getattr(choice.delta, 'reasoning_content', None)
+                if reasoning:
+                    reasoning_chunks.append(reasoning)
+
+            result = {
+                "content": "".join(chunks),
+                "finish_reason": finish_reason,
+                "usage": usage,
+                "model": model,
+                "duration": time.time() - start_time,
+                "success": True
+            }
+            if reasoning_chunks:
+                result['reasoning'] = "".join(reasoning_chunks)
+
+            return result
+
+        except Exception as e:
+            return {
+                "content": "",
+                "success": False,
+                "error": str(e),
+                "duration": time.time() - start_time
+            }
+
     def generate_resume(
         self,
         system_prompt: str,
@@ -208,3 +295,14 @@ Provide the analysis in a structured format."""
 def create_kimi_client(api_key: Optional[str] = None) -> KimiK2Client:
     """Create and return a Kimi K2 client instance"""
     return KimiK2Client(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def get_shared_kimi_client(api_key: Optional[str] = None) -> KimiK2Client:
+    """
+    Return a process-wide Kimi K2 client for api_key
+
+    Sharing the client shares its HTTP connection pool, so repeated
+    requests reuse open TLS connections instead of handshaking again.
+    """
+    return KimiK2Client(api_key=api_key)
@@ -42,6 +42,7 @@ class DatabaseCache:
     - LRU eviction policy
     - TTL support per entry
     - Pattern-based invalidation
+    - Per-namespace version counters for O(1) invalidation
     - Cache statistics
     - Thread-safe operations (for single-threaded SQLite usage)
     """
@@ -63,6 +64,11 @@ class DatabaseCache:
             'evictions': 0,
             'invalidations': 0
         }
+        # Namespace -> version; bumping a namespace orphans every key that
+        # embedded the old version, and those entries age out of the LRU.
+        # Only namespaces that have been bumped are present; the rest read
+        # as version 0 and keep scan-based invalidate() semantics.
+        self.versions: Dict[str, int] = {}
 
     def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """
@@ -168,16 +174,49 @@ class DatabaseCache:
         self.cache.clear()
         self.stats['invalidations'] += count
 
+    def bump_version(self, namespace: str) -> int:
+        """
+        Invalidate every entry keyed on a namespace by bumping its version
+
+        Args:
+            namespace: Namespace written to (e.g. 'job', 'resume')
+
+        Returns:
+            The new version number
+        """
+        version = self.versions.get(namespace, 0) + 1
+        self.versions[namespace] = version
+        return version
+
+    def version_key(self, *namespaces: str) -> str:
+        """
+        Build the version component of a cache key
+
+        Args:
+            namespaces: Namespaces the cached value depends on
+
+        Returns:
+            String such as 'job=3:resume=7'
+        """
+        return ":".join(f"{ns}={self.versions.get(ns, 0)}" for ns in namespaces)
+
     def invalidate(self, pattern: str) -> int:
         """
         Invalidate cache entries matching pattern
 
+        Versioned namespaces (ones bump_version() has been called for) are
+        invalidated by a version bump instead of a scan over every key.
+
         Args:
             pattern: String pattern to match in cache keys
 
         Returns:
-            Number of entries invalidated
+            Number of entries invalidated (0 for a versioned namespace)
         """
+        if pattern in self.versions:
+            self.bump_version(pattern)
+            return 0
+
         keys_to_delete = [k for k in self.cache.keys() if pattern in k]
 
         for key in keys_to_delete:
@@ -271,18 +310,20 @@ class DatabaseCache:
         return entries[:limit]
 
 
-def cached_query(cache: DatabaseCache, ttl_seconds: Optional[int] = None):
+def cached_query(cache: DatabaseCache, ttl_seconds: Optional[int] = None, *namespaces: str):
     """
     Decorator for caching database queries
 
     Usage:
-        @cached_query(cache, ttl_seconds=300)
+        @cached_query(cache, 300, 'user')
         def get_user(self, user_id):
             return self.cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchone()
 
     Args:
         cache: DatabaseCache instance
         ttl_seconds: TTL for this query (None = use cache default)
+        namespaces: Namespaces whose version is part of the key, so that
+            cache.bump_version(ns) invalidates the result
 
     Returns:
         Decorator function
@@ -292,6 +333,8 @@ def cached_query(cache: DatabaseCache, ttl_seconds: Optional[int] = None):
         def wrapper(*args, **kwargs):
             # Generate cache key
             cache_key = cache._generate_key(func.__name__, args, kwargs)
+            if namespaces:
+                cache_key = f"{cache_key}:{cache.version_key(*namespaces)}"
 
             # Check cache
             result = cache.get(cache_key)
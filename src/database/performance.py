@@ -37,6 +37,7 @@ class QueryPerformanceMonitor:
         self.query_stats: Dict[str, List[float]] = defaultdict(list)
         self.slow_queries: List[Dict] = []
         self.total_queries = 0
+        self.retries: Dict[str, int] = defaultdict(int)
 
     def record_query(
         self,
@@ -73,6 +74,15 @@ class QueryPerformanceMonitor:
                 f"(threshold: {self.slow_query_threshold_ms}ms)"
             )
 
+    def record_retry(self, kind: str) -> None:
+        """
+        Count a retried database operation
+
+        Args:
+            kind: Name of the operation that was retried
+        """
+        self.retries[kind] += 1
+
     def get_stats(self) -> dict:
         """
         Get aggregated query statistics
@@ -84,6 +94,7 @@ class QueryPerformanceMonitor:
             'total_queries': self.total_queries,
             'unique_queries': len(self.query_stats),
             'slow_queries_count': len(self.slow_queries),
+            'retries': dict(self.retries),
             'queries': {}
         }
 
@@ -171,6 +182,7 @@ class QueryPerformanceMonitor:
         print(f"Total queries:       {stats['total_queries']:,}")
         print(f"Unique queries:      {stats['unique_queries']}")
         print(f"Slow queries:        {stats['slow_queries_count']} (>{self.slow_query_threshold_ms}ms)")
+        print(f"Retries:             {sum(self.retries.values()):,}")
 
         if stats['queries']:
             print("\nTop queries by average execution time:")
@@ -207,6 +219,7 @@ class QueryPerformanceMonitor:
         self.query_stats.clear()
         self.slow_queries.clear()
         self.total_queries = 0
+        self.retries.clear()
 
 
 # Global monitor instance
@@ -2,6 +2,7 @@
 Database Connection Pooling
 Manages a pool of database connections for better resource utilization
 """
+import logging
 import sqlite3
 import threading
 from contextlib import contextmanager
@@ -10,6 +11,12 @@ from queue import Queue, Empty
 import time
 
 
+logger = logging.getLogger(__name__)
+
+# Prepared statements kept per connection by the sqlite3 module (default 128)
+STATEMENT_CACHE_SIZE = 256
+
+
 class DatabasePool:
     """
     Connection pool for SQLite databases
@@ -31,7 +38,8 @@ class DatabasePool:
         pool_size: int = 5,
         max_overflow: int = 10,
         timeout: float = 30.0,
-        check_same_thread: bool = False
+        check_same_thread: bool = False,
+        query_only: bool = False
     ):
         """
         Initialize connection pool
@@ -42,12 +50,14 @@ class DatabasePool:
             max_overflow: Maximum number of connections beyond pool_size
             timeout: Timeout in seconds when waiting for connection
             check_same_thread: SQLite check_same_thread parameter
+            query_only: Open connections with PRAGMA query_only, rejecting writes
         """
         self.db_path = db_path
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.timeout = timeout
         self.check_same_thread = check_same_thread
+        self.query_only = query_only
 
         # Connection pool (queue of available connections)
         self.pool: Queue = Queue(maxsize=pool_size + max_overflow)
@@ -57,8 +67,13 @@ class DatabasePool:
         self.lock = threading.Lock()
 
         # FIX: Track connection metadata separately since sqlite3.Connection doesn't support attributes
+        # created_at is a time.monotonic() reading, not wall-clock time
         self.connection_metadata = {}  # {id(conn): {'created_at': float, 'query_count': int}}
 
+        # Connection age is only checked once every (mask + 1) checkouts; the
+        # query-count check stays on every checkout since it needs no clock read
+        self.age_check_interval_mask = 63
+
         # WAL checkpoint tracking
         self.operation_count = 0
         self.last_checkpoint_time = time.time()
@@ -87,63 +102,25 @@ class DatabasePool:
         Returns:
             SQLite connection object
         """
+        # isolation_level=None stops the driver from silently opening DEFERRED
+        # transactions; writers issue BEGIN IMMEDIATE themselves so the write
+        # lock is taken up-front instead of upgraded mid-transaction
         conn = sqlite3.connect(
             self.db_path,
             check_same_thread=self.check_same_thread,
-            timeout=self.timeout
+            timeout=self.timeout,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
         )
 
         # Set row factory for dictionary-like access
         conn.row_factory = sqlite3.Row
 
-        # Enable foreign keys (wrap in try-except for Streamlit Cloud compatibility)
-        try:
-            conn.execute("PRAGMA foreign_keys = ON")
-        except Exception:
-            pass  # Foreign keys not supported or restricted
-
-        # Optimize SQLite for better performance
-        # Try WAL mode, but fall back gracefully if not supported (e.g., on Streamlit Cloud)
-        try:
-            conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
-            self.wal_mode_enabled = True  # WAL mode successfully enabled
-        except Exception:
-            # WAL mode not supported in this environment (e.g., Streamlit Cloud)
-            # Fall back to default DELETE mode - no action needed
-            self.wal_mode_enabled = False
-            pass
-
-        # Wrap all performance PRAGMA statements for Streamlit Cloud compatibility
-        try:
-            conn.execute("PRAGMA synchronous = NORMAL")  # Balance durability/performance
-        except Exception:
-            pass  # Not supported in restricted environment
-
-        try:
-            conn.execute("PRAGMA busy_timeout = 10000")  # 10 second timeout for locks
-        except Exception:
-            pass  # Not supported in restricted environment
-
-        try:
-            conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-        except Exception:
-            pass  # Not supported in restricted environment
-
-        try:
-            conn.execute("PRAGMA temp_store = MEMORY")  # Store temp tables in memory
-        except Exception:
-            pass  # Not supported in restricted environment
-
-        # Try memory-mapped I/O, but fall back if not supported
-        try:
-            conn.execute("PRAGMA mmap_size = 268435456")  # 256MB memory-mapped I/O
-        except Exception:
-            # Memory-mapped I/O not supported - continue without it
-            pass
+        self._configure_connection(conn)
 
         # FIX: Track connection metadata in separate dictionary
         self.connection_metadata[id(conn)] = {
-            'created_at': time.time(),
+            'created_at': time.monotonic(),
             'query_count': 0
         }
 
@@ -151,6 +128,42 @@ class DatabasePool:
 
         return conn
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Apply the per-connection PRAGMAs
+
+        journal_mode=WAL is persistent in the database file, but every other
+        setting here only lasts for the connection, so this runs on each new
+        pooled connection. Every PRAGMA is optional: restricted environments
+        (e.g., Streamlit Cloud) may reject some of them.
+        """
+        # Try WAL mode, but fall back gracefully if not supported (e.g., on
+        # Streamlit Cloud). In-memory databases can't use WAL.
+        if self.db_path != ":memory:":
+            try:
+                conn.execute("PRAGMA journal_mode = WAL")  # Write-Ahead Logging
+                self.wal_mode_enabled = True  # WAL mode successfully enabled
+            except Exception:
+                # Fall back to default DELETE mode - no action needed
+                self.wal_mode_enabled = False
+
+        for pragma in (
+            "PRAGMA foreign_keys = ON",
+            "PRAGMA synchronous = NORMAL",  # Balance durability/performance
+            "PRAGMA busy_timeout = 10000",  # 10 second timeout for locks
+            "PRAGMA cache_size = -64000",  # 64MB cache
+            "PRAGMA temp_store = MEMORY",  # Store temp tables in memory
+            "PRAGMA mmap_size = 268435456",  # 256MB memory-mapped I/O
+        ):
+            try:
+                conn.execute(pragma)
+            except Exception:
+                pass  # Not supported in restricted environment
+
+        # Set last: journal_mode above may need to write the database header
+        if self.query_only:
+            conn.execute("PRAGMA query_only = 1")
+
     def _initialize_pool(self):
         """Initialize the connection pool with initial connections"""
         for _ in range(self.pool_size):
@@ -187,6 +200,10 @@ class DatabasePool:
         """
         Check if a connection should be recycled based on age or query count
 
+        The query count is checked on every checkout. The age check reads the
+        clock, so it only runs once every 64 checkouts - recycling after one
+        hour does not need to be accurate to the second.
+
         Args:
             conn: Connection to check
 
@@ -201,17 +218,21 @@ class DatabasePool:
             # No metadata found, don't recycle
             return False
 
-        # Recycle connections older than 1 hour
-        max_age_seconds = 3600  # 1 hour
-        age = time.time() - metadata['created_at']
-        if age > max_age_seconds:
-            return True
-
         # Recycle connections after 10,000 queries
         max_queries = 10000
         if metadata['query_count'] > max_queries:
             return True
 
+        # Only sample the clock periodically
+        if self.stats['pool_checkouts'] & self.age_check_interval_mask:
+            return False
+
+        # Recycle connections older than 1 hour
+        max_age_seconds = 3600  # 1 hour
+        age = time.monotonic() - metadata['created_at']
+        if age > max_age_seconds:
+            return True
+
         return False
 
     @contextmanager
@@ -283,6 +304,13 @@ class DatabasePool:
         finally:
             # Return connection to pool or close if overflow
             if conn:
+                # Never hand a connection with an open transaction back to the pool
+                if conn.in_transaction:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+
                 if is_overflow:
                     self._cleanup_connection_metadata(conn)  # FIX: Clean up metadata
                     conn.close()
@@ -295,7 +323,7 @@ class DatabasePool:
                         self.pool.put_nowait(conn)
                     except Exception as e:
                         # Pool full (shouldn't happen), close connection
-                        print(f"Warning: Failed to return connection to pool: {e}")
+                        logger.warning("Failed to return connection to pool: %s", e)
                         self._cleanup_connection_metadata(conn)  # FIX: Clean up metadata
                         conn.close()
                         self.stats['connections_closed'] += 1
@@ -332,9 +360,16 @@ class DatabasePool:
             params_list: List of parameter tuples
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.executemany(query, params_list)
-            conn.commit()
+            # Writes never read rows back, so skip sqlite3.Row construction
+            conn.row_factory = None
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                # Commits on success, rolls back on error
+                with conn:
+                    cursor.executemany(query, params_list)
+            finally:
+                conn.row_factory = sqlite3.Row
 
     def execute_write(self, query: str, params: tuple = ()) -> int:
         """
@@ -348,15 +383,22 @@ class DatabasePool:
             Last row ID (for INSERT) or number of affected rows
         """
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
+            # Writes never read rows back, so skip sqlite3.Row construction
+            conn.row_factory = None
+            try:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                # Commits on success, rolls back on error
+                with conn:
+                    cursor.execute(query, params)
+            finally:
+                conn.row_factory = sqlite3.Row
 
-            # Track operations and checkpoint WAL if needed
-            self.operation_count += 1
-            self._maybe_checkpoint_wal()
+        # Track operations and checkpoint WAL if needed
+        self.operation_count += 1
+        self._maybe_checkpoint_wal()
 
-            return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
+        return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
 
     def _maybe_checkpoint_wal(self) -> None:
         """
@@ -382,17 +424,18 @@ class DatabasePool:
                 with self.get_connection() as conn:
                     # TRUNCATE mode: Checkpoint and truncate WAL file
                     conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-                    conn.commit()
+
+                logger.debug(
+                    "WAL checkpoint completed (operations: %d, time since last: %.0fs)",
+                    self.operation_count, time_since_last
+                )
 
                 self.operation_count = 0
                 self.last_checkpoint_time = current_time
                 self.stats['wal_checkpoints'] += 1
-
-                print(f"WAL checkpoint completed (operations: {self.operation_count}, "
-                      f"time since last: {time_since_last:.0f}s)")
             except Exception as e:
                 # Don't fail the operation if checkpoint fails - just log
-                print(f"Warning: WAL checkpoint failed: {e}")
+                logger.warning("WAL checkpoint failed: %s", e)
 
     def checkpoint_wal_now(self) -> bool:
         """
@@ -408,14 +451,13 @@ class DatabasePool:
         try:
             with self.get_connection() as conn:
                 conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
-                conn.commit()
 
             self.operation_count = 0
             self.last_checkpoint_time = time.time()
             self.stats['wal_checkpoints'] += 1
             return True
         except Exception as e:
-            print(f"Error: WAL checkpoint failed: {e}")
+            logger.error("WAL checkpoint failed: %s", e)
             return False
 
     def get_stats(self) -> dict:
@@ -492,7 +534,8 @@ class SingletonPool:
     """
     Singleton pattern for database pool
 
-    Ensures only one pool instance exists per database path
+    Ensures only one pool instance exists per database path and mode
+    (read-write or query-only)
     """
 
     _instances: dict = {}
@@ -504,7 +547,8 @@ class SingletonPool:
         db_path: str,
         pool_size: int = 5,
         max_overflow: int = 10,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        query_only: bool = False
     ) -> DatabasePool:
         """
         Get or create pool for database path
@@ -514,20 +558,23 @@ class SingletonPool:
             pool_size: Number of connections in pool
             max_overflow: Maximum overflow connections
             timeout: Connection timeout in seconds
+            query_only: Get the read-only pool for this path
 
         Returns:
             DatabasePool instance
         """
+        key = (db_path, query_only)
         with cls._lock:
-            if db_path not in cls._instances:
-                cls._instances[db_path] = DatabasePool(
+            if key not in cls._instances:
+                cls._instances[key] = DatabasePool(
                     db_path=db_path,
                     pool_size=pool_size,
                     max_overflow=max_overflow,
                     timeout=timeout,
-                    check_same_thread=False
+                    check_same_thread=False,
+                    query_only=query_only
                 )
-            return cls._instances[db_path]
+            return cls._instances[key]
 
     @classmethod
     def close_all_pools(cls) -> None:
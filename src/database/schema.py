@@ -1,367 +1,832 @@
 """
 Database schema for storing job descriptions and generated resumes
 """
+import hashlib
 import sqlite3
 import json
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 
+# orjson is optional: its C codec is several times faster than the stdlib
+# for the score breakdown dicts. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the same exception either way.
+try:
+    import orjson
+
+    def _json_dumps(value):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# zstandard is optional: when installed, large text columns (resume and
+# cover letter content, company research, versions) are stored as
+# zstd-compressed BLOBs. Readers tell the two apart by type - str rows are
+# plain text, bytes rows are compressed - so existing rows need no migration.
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Smaller values are stored as plain text; compression doesn't pay off
+COMPRESS_MIN_BYTES = 1024
+_ZSTD_LEVEL = 3
+
+# STRICT tables (SQLite 3.37+) store each value with its declared type and
+# skip affinity conversion; older SQLite builds (e.g. some hosted runtimes)
+# fall back to regular tables
+_TABLE_OPTIONS = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+
+# Large text columns hold either TEXT or compressed BLOB values. STRICT
+# tables need ANY for that; plain TEXT affinity stores BLOBs unchanged.
+_CONTENT_TYPE = "ANY" if _TABLE_OPTIONS else "TEXT"
+
+# ATS scores can be fractional (ATSScorer rounds to one decimal), which a
+# STRICT INTEGER column rejects; INTEGER affinity on a plain table keeps
+# them as REAL values already
+_SCORE_TYPE = "REAL" if _TABLE_OPTIONS else "INTEGER"
+
+# Compiled statements kept per connection by the sqlite3 module (default 128)
+STATEMENT_CACHE_SIZE = 256
+
+# PRAGMA user_version once the scoring columns have been added
+SCHEMA_VERSION_SCORING_FIELDS = 1
+# PRAGMA user_version once created_at columns hold unix seconds
+SCHEMA_VERSION_UNIX_TIMESTAMPS = 2
+# PRAGMA user_version once STRICT tables declare ats_score REAL
+SCHEMA_VERSION_REAL_ATS_SCORE = 3
+# PRAGMA user_version once job descriptions are deduplicated by hash
+SCHEMA_VERSION_JOB_DESCRIPTION_HASH = 4
+
+# created_at stores unix seconds as INTEGER (smaller rows and index keys
+# than ISO text); queries format it back with datetime(..., 'unixepoch'),
+# which yields the same 'YYYY-MM-DD HH:MM:SS' text CURRENT_TIMESTAMP did
+_SQL_NOW = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# A created_at value as unix seconds, converting ISO text
+_SQL_CREATED_AT_TO_UNIX = (
+    "CASE WHEN typeof(created_at) = 'text' "
+    "THEN CAST(strftime('%s', created_at) AS INTEGER) ELSE created_at END"
+)
+
+# created_at definitions from before SCHEMA_VERSION_UNIX_TIMESTAMPS
+_LEGACY_CREATED_AT = re.compile(
+    r"created_at\s+(?:TEXT|TIMESTAMP)\s+DEFAULT\s+CURRENT_TIMESTAMP", re.IGNORECASE
+)
+
+# ats_score definition of STRICT tables from before SCHEMA_VERSION_REAL_ATS_SCORE
+_STRICT_INTEGER_ATS_SCORE = re.compile(r"\bats_score\s+INTEGER\b", re.IGNORECASE)
+
+# Values used for keys missing from a score_data dict
+_DEFAULT_SCORE = {
+    'score': 0,
+    'grade': 'N/A',
+    'color': 'red',
+    'pass_probability': 0.0,
+    'category_scores': {},
+}
+
+# Rows pulled per fetchmany() call when streaming result sets
+FETCH_BATCH_SIZE = 256
+
+# Rows per transaction for the insert_*_many bulk APIs
+BULK_CHUNK_SIZE = 10000
+
+# Job ids remembered by each check_*_exists lookup cache
+EXISTS_CACHE_SIZE = 1024
+
+_SQL_ALL_RESUMES = """
+    SELECT
+        r.id,
+        j.company_name,
+        j.job_title,
+        r.file_path,
+        r.ats_score,
+        datetime(r.created_at, 'unixepoch') AS created_at
+    FROM generated_resumes r
+    JOIN job_descriptions j ON r.job_description_id = j.id
+    ORDER BY r.created_at DESC
+"""
+
+# Trend columns come from window functions, so SQLite computes them in the
+# same pass as the sort: score_delta is the change from the previous resume
+# for the same company, score_avg_5 the moving average of the last 5 scores.
+# The windows run over every resume in the subquery; the job filter and
+# LIMIT apply outside it, so filtering doesn't change the trend values.
+_SQL_SCORE_HISTORY_COLUMNS = """
+    SELECT
+        id,
+        ats_score,
+        ats_grade,
+        ats_color,
+        pass_probability,
+        datetime(created_at, 'unixepoch') AS created_at,
+        company_name,
+        job_title,
+        score_delta,
+        score_avg_5
+    FROM (
+        SELECT
+            r.id,
+            r.job_description_id,
+            r.ats_score,
+            r.ats_grade,
+            r.ats_color,
+            r.pass_probability,
+            r.created_at,
+            j.company_name,
+            j.job_title,
+            r.ats_score - LAG(r.ats_score) OVER (
+                PARTITION BY j.company_name ORDER BY r.created_at, r.id
+            ) AS score_delta,
+            AVG(r.ats_score) OVER (
+                ORDER BY r.created_at, r.id ROWS BETWEEN 4 PRECEDING AND CURRENT ROW
+            ) AS score_avg_5
+        FROM generated_resumes r
+        JOIN job_descriptions j ON r.job_description_id = j.id
+    ) history
+"""
+
+_SQL_SCORE_HISTORY_FOR_JOB = _SQL_SCORE_HISTORY_COLUMNS + """
+    WHERE history.job_description_id = ?
+    ORDER BY history.created_at DESC, history.id DESC
+    LIMIT ?
+"""
+
+_SQL_SCORE_HISTORY = _SQL_SCORE_HISTORY_COLUMNS + """
+    ORDER BY history.created_at DESC, history.id DESC
+    LIMIT ?
+"""
+
+# Statements that interpolate other constants are built once here rather
+# than per call, so each call passes the same str object and the
+# statement cache lookup reuses its cached hash
+_SQL_EXISTS = """
+    SELECT id, file_path, datetime(created_at, 'unixepoch') AS created_at
+    FROM {table}
+    WHERE job_description_id = ?
+"""
+_SQL_RESUME_EXISTS = _SQL_EXISTS.format(table="generated_resumes")
+_SQL_COVER_LETTER_EXISTS = _SQL_EXISTS.format(table="generated_cover_letters")
+
+_SQL_UPDATE_RESUME_CONTENT = f"""
+    UPDATE generated_resumes
+    SET resume_content = ?,
+        created_at = {_SQL_NOW}
+    WHERE id = ?
+"""
+
+_SQL_SAVE_COMPANY_RESEARCH = f"""
+    INSERT INTO company_research (company_name, research_data)
+    VALUES (?, ?)
+    ON CONFLICT(company_name) DO UPDATE SET
+        research_data = excluded.research_data,
+        created_at = {_SQL_NOW}
+"""
+
+
+def _pack(text):
+    """Compress a large text value for storage (no-op without zstandard)"""
+    if ZSTD_AVAILABLE and text is not None and len(text) >= COMPRESS_MIN_BYTES:
+        return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(text.encode("utf-8"))
+    return text
+
+
+def _unpack(value):
+    """Return the text of a stored value, decompressing BLOBs"""
+    if isinstance(value, bytes):
+        return zstandard.ZstdDecompressor().decompress(value).decode("utf-8")
+    return value
+
+
+def _like_contains(text):
+    """LIKE pattern matching text literally anywhere (use with ESCAPE '\\')"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _job_description_hash(job_description):
+    """SHA-256 of a job description, stored in job_description_hash"""
+    return hashlib.sha256(job_description.encode()).digest()
+
+
+def _rebuild_table(conn, table, create_sql, values=None):
+    """
+    Recreate table from create_sql, copying its rows and indexes.
+
+    SQLite can't change a column's type in place. values maps a column
+    name to the SQL expression its copied value is computed from; other
+    columns are copied as they are. Must run inside a transaction, with
+    PRAGMA foreign_keys off (it can't be changed inside one): dropping a
+    table that other rows reference fails otherwise. Raises
+    sqlite3.IntegrityError if the rebuild leaves a reference dangling
+    that wasn't already.
+    """
+    values = values or {}
+    violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    indexes = [row[0] for row in conn.execute("""
+        SELECT sql FROM sqlite_master
+        WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL
+    """, (table,))]
+    columns = [col[1] for col in conn.execute(f"PRAGMA table_info({table})")]
+
+    conn.execute(create_sql.replace(table, f"{table}_new", 1))
+    conn.execute(f"""
+        INSERT INTO {table}_new ({', '.join(columns)})
+        SELECT {', '.join(values.get(col, col) for col in columns)} FROM {table}
+    """)
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    for index_sql in indexes:
+        conn.execute(index_sql)
+
+    if len(conn.execute("PRAGMA foreign_key_check").fetchall()) > len(violations):
+        raise sqlite3.IntegrityError(f"Rebuilding {table} broke a foreign key reference")
+
+
+def _migrate_created_at(conn):
+    """
+    Convert created_at columns holding ISO text to unix seconds.
+
+    Tables still declaring a CURRENT_TIMESTAMP default are rebuilt from
+    their stored CREATE statement, converting the timestamp as rows are
+    copied. Text values left in already converted tables (plain tables
+    don't enforce the INTEGER type) are converted in place. Shared with
+    schema_optimized.OptimizedDatabase, which uses the same tables. Must
+    run inside a transaction.
+    """
+    tables = conn.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'table' AND name IN (
+            'job_descriptions', 'generated_resumes', 'company_research',
+            'generated_cover_letters', 'resume_versions'
+        )
+    """).fetchall()
+
+    for table, create_sql in tables:
+        new_sql, replaced = _LEGACY_CREATED_AT.subn(
+            f"created_at INTEGER DEFAULT ({_SQL_NOW})", create_sql
+        )
+        if replaced:
+            _rebuild_table(conn, table, new_sql, {"created_at": _SQL_CREATED_AT_TO_UNIX})
+        else:
+            conn.execute(f"""
+                UPDATE {table} SET created_at = {_SQL_CREATED_AT_TO_UNIX}
+                WHERE typeof(created_at) = 'text'
+            """)
+
+
+def _migrate_jd_hash(conn):
+    """
+    Deduplicate job descriptions on a hash of their text.
+
+    Adds job_description_hash to tables created without it, fills in any
+    row still missing one and creates the UNIQUE idx_jd_hash index both
+    layers use as their conflict target. Tables created with
+    UNIQUE(company_name, job_description) keep it, since dropping it would
+    mean rebuilding the table. Shared with
+    schema_optimized.OptimizedDatabase. Must run inside a transaction.
+    """
+    conn.create_function("sha256_digest", 1, _job_description_hash, deterministic=True)
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(job_descriptions)")}
+    if 'job_description_hash' not in columns:
+        conn.execute("ALTER TABLE job_descriptions ADD COLUMN job_description_hash BLOB")
+    conn.execute("""
+        UPDATE job_descriptions SET job_description_hash = sha256_digest(job_description)
+        WHERE job_description_hash IS NULL
+    """)
+    conn.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jd_hash
+        ON job_descriptions(company_name, job_description_hash)
+    """)
+
+
+def _parse_breakdown(value):
+    """Decode a stored score_breakdown, returning None if missing or invalid"""
+    if not value:
+        return None
+    try:
+        return _json_loads(value)
+    except json.JSONDecodeError:
+        return None
+
+
+def _iter_dicts(cursor):
+    """Yield each row of cursor as a dict, fetching FETCH_BATCH_SIZE rows at a time"""
+    while True:
+        batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+        if not batch:
+            break
+        for row in batch:
+            yield dict(row)
+
+
 class Database:
     def __init__(self, db_path="resume_generator.db"):
         self.db_path = db_path
+
+        # One long-lived connection per thread instead of connect/close per call
+        self._local = threading.local()
+        self._connections = []
+        # Serializes writers from different threads of this process
+        self._lock = threading.RLock()
+
+        # check_*_exists results by job_description_id (LRU order). Writes
+        # through this instance invalidate them; writes from other
+        # processes are not seen until the entry is evicted.
+        self._resume_exists = OrderedDict()
+        self._cover_letter_exists = OrderedDict()
+
         self.init_database()
         self._migrate_scoring_fields()
+        self._migrate_unix_timestamps()
+        self._migrate_real_ats_score()
+        self._migrate_job_description_hash()
 
     def get_connection(self):
-        """Get database connection"""
+        """Get a new, caller-owned database connection"""
         return sqlite3.connect(self.db_path)
 
-    def init_database(self):
-        """Initialize database schema"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Job descriptions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS job_descriptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company_name TEXT NOT NULL,
-                job_title TEXT,
-                job_description TEXT NOT NULL,
-                job_url TEXT,
-                keywords TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(company_name, job_description)
-            )
-        """)
-
-        # Generated resumes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS generated_resumes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_description_id INTEGER NOT NULL,
-                resume_content TEXT NOT NULL,
-                ats_score INTEGER,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
-                UNIQUE(job_description_id)
-            )
-        """)
-
-        # Company research cache (from Perplexity)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS company_research (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company_name TEXT UNIQUE NOT NULL,
-                research_data TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        # Generated cover letters table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS generated_cover_letters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_description_id INTEGER NOT NULL,
-                resume_id INTEGER,
-                cover_letter_content TEXT NOT NULL,
-                file_path TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
-                FOREIGN KEY (resume_id) REFERENCES generated_resumes(id),
-                UNIQUE(job_description_id)
-            )
-        """)
-
-        # Resume versions table for tracking edit history
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS resume_versions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                resume_id INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                version_notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (resume_id) REFERENCES generated_resumes(id) ON DELETE CASCADE
-            )
-        """)
+    def _conn(self):
+        """
+        Get this thread's cached connection, opening it on first use.
 
-        # Create index for faster version queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_version_resume
-            ON resume_versions(resume_id, created_at DESC)
-        """)
+        The connection runs in autocommit mode (isolation_level=None), so
+        single statements commit on their own and multi-statement writes
+        use explicit BEGIN IMMEDIATE / COMMIT.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open(self.db_path)
+            self._local.conn = conn
+        return conn
 
-        conn.commit()
-        conn.close()
+    def _reader(self):
+        """
+        Get this thread's cached read-only connection, opening it on first use.
 
-    def insert_job_description(self, company_name, job_description, job_title=None, job_url=None, keywords=None):
-        """Insert or get existing job description"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        SELECTs run here so they keep their own statement and page cache
+        and never queue behind a write on the writer connection; under WAL
+        they read the last committed state. In-memory databases can't be
+        shared between connections, so they read through _conn().
+        """
+        if self.db_path == ":memory:":
+            return self._conn()
+
+        conn = getattr(self._local, "reader", None)
+        if conn is None:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = self._open(uri, uri=True)
+            self._local.reader = conn
+        return conn
+
+    def _open(self, database, uri=False):
+        """Open and tune a connection, tracking it for close()"""
+        conn = sqlite3.connect(
+            database,
+            uri=uri,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        # Rows map column names to values, so results convert with dict(row)
+        conn.row_factory = sqlite3.Row
+        # Lets SQL filter on compressed content without a Python round trip
+        conn.create_function("zstd_decompress", 1, _unpack, deterministic=True)
+        for pragma in (
+            "PRAGMA journal_mode = WAL",
+            "PRAGMA synchronous = NORMAL",
+            "PRAGMA temp_store = MEMORY",
+            "PRAGMA cache_size = -64000",
+            "PRAGMA mmap_size = 268435456",
+        ):
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error:
+                pass  # Not supported in restricted environments
+
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close every cached connection opened by this instance"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
+
+    @contextmanager
+    def bulk(self):
+        """
+        Relax durability for a large load on this thread's connection.
+
+        Usage:
+            with db.bulk():
+                db.insert_job_descriptions_many(rows)
 
+        synchronous is set to OFF for the duration and restored to NORMAL
+        afterwards, even if the load fails.
+        """
+        conn = self._conn()
+        conn.execute("PRAGMA synchronous = OFF")
         try:
+            yield self
+        finally:
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+    @contextmanager
+    def _write(self):
+        """
+        Run a write transaction on this thread's connection.
+
+        BEGIN IMMEDIATE takes the write lock up front instead of upgrading
+        a deferred transaction on its first write, which can fail with
+        SQLITE_BUSY under concurrent writers. Commits on success and rolls
+        back on any exception.
+        """
+        with self._lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def _executemany_chunked(self, sql, rows):
+        """
+        Run executemany() in BULK_CHUNK_SIZE-row transactions.
+
+        Returns:
+            Total number of rows changed
+        """
+        rows = iter(rows)
+        total = 0
+
+        while True:
+            chunk = list(islice(rows, BULK_CHUNK_SIZE))
+            if not chunk:
+                break
+
+            with self._write() as conn:
+                total += conn.executemany(sql, chunk).rowcount
+
+        return total
+
+    def init_database(self):
+        """Initialize database schema"""
+        with self._lock:
+            cursor = self._conn().cursor()
+
+            # Job descriptions table
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS job_descriptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_name TEXT NOT NULL,
+                    job_title TEXT,
+                    job_description TEXT NOT NULL,
+                    job_url TEXT,
+                    keywords TEXT,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
+                    job_description_hash BLOB
+                ){_TABLE_OPTIONS}
+            """)
+
+            # Generated resumes table
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS generated_resumes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_description_id INTEGER NOT NULL,
+                    resume_content {_CONTENT_TYPE} NOT NULL,
+                    ats_score {_SCORE_TYPE},
+                    file_path TEXT,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
+                    FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
+                    UNIQUE(job_description_id)
+                ){_TABLE_OPTIONS}
+            """)
+
+            # Company research cache (from Perplexity)
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS company_research (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_name TEXT UNIQUE NOT NULL,
+                    research_data {_CONTENT_TYPE},
+                    created_at INTEGER DEFAULT ({_SQL_NOW})
+                ){_TABLE_OPTIONS}
+            """)
+
+            # Generated cover letters table
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS generated_cover_letters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_description_id INTEGER NOT NULL,
+                    resume_id INTEGER,
+                    cover_letter_content {_CONTENT_TYPE} NOT NULL,
+                    file_path TEXT,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
+                    FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
+                    FOREIGN KEY (resume_id) REFERENCES generated_resumes(id),
+                    UNIQUE(job_description_id)
+                ){_TABLE_OPTIONS}
+            """)
+
+            # Resume versions table for tracking edit history
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS resume_versions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    resume_id INTEGER NOT NULL,
+                    content {_CONTENT_TYPE} NOT NULL,
+                    version_notes TEXT,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
+                    FOREIGN KEY (resume_id) REFERENCES generated_resumes(id) ON DELETE CASCADE
+                ){_TABLE_OPTIONS}
+            """)
+
+            # Create index for faster version queries
             cursor.execute("""
-                INSERT INTO job_descriptions (company_name, job_title, job_description, job_url, keywords)
-                VALUES (?, ?, ?, ?, ?)
-            """, (company_name, job_title, job_description, job_url, keywords))
-            conn.commit()
-            job_id = cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Job description already exists
+                CREATE INDEX IF NOT EXISTS idx_version_resume
+                ON resume_versions(resume_id, created_at DESC)
+            """)
+
+            # The point lookups (existence checks, company research) are
+            # already served by the UNIQUE autoindexes, and the
+            # job-description conflict by idx_jd_hash (see
+            # _migrate_jd_hash). The history queries sort by created_at,
+            # which otherwise needs a temp B-tree sort over every resume.
             cursor.execute("""
-                SELECT id FROM job_descriptions
-                WHERE company_name = ? AND job_description = ?
-            """, (company_name, job_description))
-            job_id = cursor.fetchone()[0]
+                CREATE INDEX IF NOT EXISTS idx_resume_created
+                ON generated_resumes(created_at DESC)
+            """)
+
+            # Refresh planner statistics where they are missing or stale
+            try:
+                cursor.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # Not supported in restricted environments
+
+    def insert_job_description(self, company_name, job_description, job_title=None, job_url=None, keywords=None):
+        """Insert or get existing job description"""
+        # The no-op DO UPDATE (rather than DO NOTHING) makes RETURNING yield
+        # the existing row's id when the job description is already stored
+        with self._write() as conn:
+            job_id = conn.execute("""
+                INSERT INTO job_descriptions
+                    (company_name, job_title, job_description, job_url, keywords, job_description_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(company_name, job_description_hash) DO UPDATE SET
+                    company_name = excluded.company_name
+                RETURNING id
+            """, (company_name, job_title, job_description, job_url, keywords,
+                  _job_description_hash(job_description))).fetchone()[0]
 
-        conn.close()
         return job_id
 
+    def insert_job_descriptions_many(self, rows):
+        """
+        Bulk insert job descriptions, skipping ones that already exist.
+
+        Args:
+            rows: Iterable of (company_name, job_description, job_title,
+                job_url, keywords) tuples
+
+        Returns:
+            Number of rows inserted
+        """
+        return self._executemany_chunked("""
+            INSERT OR IGNORE INTO job_descriptions
+                (company_name, job_description, job_title, job_url, keywords, job_description_hash)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, ((*row, _job_description_hash(row[1])) for row in rows))
+
+    def _check_exists(self, cache, sql, job_description_id):
+        """Run an existence query for a job, answering from cache when possible"""
+        with self._lock:
+            if job_description_id in cache:
+                cache.move_to_end(job_description_id)
+            else:
+                result = self._reader().execute(sql, (job_description_id,)).fetchone()
+
+                cache[job_description_id] = dict(result) if result else None
+                if len(cache) > EXISTS_CACHE_SIZE:
+                    cache.popitem(last=False)
+
+            result = cache[job_description_id]
+
+        # Copy so callers can't modify the cached entry
+        return dict(result) if result else None
+
     def check_resume_exists(self, job_description_id):
         """Check if resume already generated for this job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return self._check_exists(self._resume_exists, _SQL_RESUME_EXISTS, job_description_id)
 
-        cursor.execute("""
-            SELECT id, file_path, created_at FROM generated_resumes
-            WHERE job_description_id = ?
-        """, (job_description_id,))
+    def insert_generated_resume(self, job_description_id, resume_content, file_path, ats_score=None):
+        """Insert generated resume, updating it if one already exists for the job"""
+        with self._write() as conn:
+            resume_id = conn.execute("""
+                INSERT INTO generated_resumes (job_description_id, resume_content, file_path, ats_score)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    resume_content = excluded.resume_content,
+                    file_path = excluded.file_path,
+                    ats_score = excluded.ats_score
+                RETURNING id
+            """, (job_description_id, _pack(resume_content), file_path, ats_score)).fetchone()[0]
+            self._resume_exists.pop(job_description_id, None)
 
-        result = cursor.fetchone()
-        conn.close()
+        return resume_id
 
-        if result:
-            return {
-                "id": result[0],
-                "file_path": result[1],
-                "created_at": result[2]
-            }
-        return None
+    def insert_generated_resumes_many(self, rows):
+        """
+        Bulk insert generated resumes, replacing the content of existing ones.
 
-    def insert_generated_resume(self, job_description_id, resume_content, file_path, ats_score=None):
-        """Insert generated resume"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        Args:
+            rows: Iterable of (job_description_id, resume_content, file_path,
+                ats_score) tuples
 
+        Returns:
+            Number of rows inserted or updated
+        """
         try:
-            cursor.execute("""
+            return self._executemany_chunked("""
                 INSERT INTO generated_resumes (job_description_id, resume_content, file_path, ats_score)
                 VALUES (?, ?, ?, ?)
-            """, (job_description_id, resume_content, file_path, ats_score))
-            conn.commit()
-            resume_id = cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Resume already exists, update it
-            cursor.execute("""
-                UPDATE generated_resumes
-                SET resume_content = ?, file_path = ?, ats_score = ?
-                WHERE job_description_id = ?
-            """, (resume_content, file_path, ats_score, job_description_id))
-            conn.commit()
-            cursor.execute("""
-                SELECT id FROM generated_resumes WHERE job_description_id = ?
-            """, (job_description_id,))
-            resume_id = cursor.fetchone()[0]
-
-        conn.close()
-        return resume_id
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    resume_content = excluded.resume_content,
+                    file_path = excluded.file_path,
+                    ats_score = excluded.ats_score
+            """, ((row[0], _pack(row[1]), *row[2:]) for row in rows))
+        finally:
+            with self._lock:
+                self._resume_exists.clear()
 
     def get_company_research(self, company_name):
         """Get cached company research"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT research_data FROM company_research
             WHERE company_name = ?
         """, (company_name,))
 
         result = cursor.fetchone()
-        conn.close()
 
-        return result[0] if result else None
+        return _unpack(result[0]) if result else None
 
     def save_company_research(self, company_name, research_data):
         """Save company research to cache"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        # UPSERT updates the row in place; INSERT OR REPLACE would delete
+        # and re-insert it under a new id
+        with self._write() as conn:
+            conn.execute(_SQL_SAVE_COMPANY_RESEARCH, (company_name, _pack(research_data)))
 
-        cursor.execute("""
-            INSERT OR REPLACE INTO company_research (company_name, research_data)
-            VALUES (?, ?)
-        """, (company_name, research_data))
+    def get_all_resumes(self):
+        """
+        Get all generated resumes with job info.
 
-        conn.commit()
-        conn.close()
+        Use iter_all_resumes() when the rows don't need to be held as a list.
 
-    def get_all_resumes(self):
-        """Get all generated resumes with job info"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        Returns:
+            List of resume dicts, newest first
+        """
+        return list(self.iter_all_resumes())
+
+    def iter_all_resumes(self):
+        """
+        Stream all generated resumes with job info.
+
+        Rows are fetched in batches of FETCH_BATCH_SIZE, so memory stays
+        bounded for long histories.
+
+        Yields:
+            Resume dicts, newest first
+        """
+        # Same SQL text on every call, so SQLite's statement cache reuses the plan
+        return _iter_dicts(self._reader().execute(_SQL_ALL_RESUMES))
 
-        cursor.execute("""
+    def search_resumes(self, text, limit=50):
+        """
+        Find resumes whose content contains text (case-insensitive).
+
+        % and _ in text match themselves rather than acting as wildcards.
+
+        Decompression runs inside the query via zstd_decompress, so only
+        the matching rows' metadata comes back to Python.
+
+        Yields:
+            Resume dicts, newest first
+        """
+        return _iter_dicts(self._reader().execute("""
             SELECT
                 r.id,
                 j.company_name,
                 j.job_title,
                 r.file_path,
                 r.ats_score,
-                r.created_at
+                datetime(r.created_at, 'unixepoch') AS created_at
             FROM generated_resumes r
             JOIN job_descriptions j ON r.job_description_id = j.id
+            WHERE zstd_decompress(r.resume_content) LIKE ? ESCAPE '\\'
             ORDER BY r.created_at DESC
-        """)
-
-        results = cursor.fetchall()
-        conn.close()
-
-        return [{
-            "id": row[0],
-            "company_name": row[1],
-            "job_title": row[2],
-            "file_path": row[3],
-            "ats_score": row[4],
-            "created_at": row[5]
-        } for row in results]
+            LIMIT ?
+        """, (_like_contains(text), limit)))
 
     def check_cover_letter_exists(self, job_description_id):
         """Check if cover letter already generated for this job"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, file_path, created_at FROM generated_cover_letters
-            WHERE job_description_id = ?
-        """, (job_description_id,))
-
-        result = cursor.fetchone()
-        conn.close()
-
-        if result:
-            return {
-                "id": result[0],
-                "file_path": result[1],
-                "created_at": result[2]
-            }
-        return None
+        return self._check_exists(
+            self._cover_letter_exists, _SQL_COVER_LETTER_EXISTS, job_description_id
+        )
 
     def insert_generated_cover_letter(self, job_description_id, cover_letter_content, file_path, resume_id=None):
-        """Insert generated cover letter"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
+        """Insert generated cover letter, updating it if one already exists for the job"""
+        with self._write() as conn:
+            cover_letter_id = conn.execute("""
                 INSERT INTO generated_cover_letters (job_description_id, resume_id, cover_letter_content, file_path)
                 VALUES (?, ?, ?, ?)
-            """, (job_description_id, resume_id, cover_letter_content, file_path))
-            conn.commit()
-            cover_letter_id = cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Cover letter already exists, update it
-            cursor.execute("""
-                UPDATE generated_cover_letters
-                SET cover_letter_content = ?, file_path = ?, resume_id = ?
-                WHERE job_description_id = ?
-            """, (cover_letter_content, file_path, resume_id, job_description_id))
-            conn.commit()
-            cursor.execute("""
-                SELECT id FROM generated_cover_letters WHERE job_description_id = ?
-            """, (job_description_id,))
-            cover_letter_id = cursor.fetchone()[0]
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    cover_letter_content = excluded.cover_letter_content,
+                    file_path = excluded.file_path,
+                    resume_id = excluded.resume_id
+                RETURNING id
+            """, (job_description_id, resume_id, _pack(cover_letter_content), file_path)).fetchone()[0]
+            self._cover_letter_exists.pop(job_description_id, None)
 
-        conn.close()
         return cover_letter_id
 
     def update_resume_content(self, resume_id, new_content):
         """Update resume content after editing"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        try:
-            # TRANSACTION FIX: Use single transaction for both operations
-            # First, get the current content to save as a version
-            cursor.execute("""
-                SELECT resume_content FROM generated_resumes WHERE id = ?
-            """, (resume_id,))
-            result = cursor.fetchone()
-
-            if result:
-                old_content = result[0]
-                # Save the old version to history (in same transaction)
-                cursor.execute("""
-                    INSERT INTO resume_versions (resume_id, content, version_notes)
-                    VALUES (?, ?, ?)
-                """, (resume_id, old_content, "Auto-saved before edit"))
-
-            # Update the resume content
-            cursor.execute("""
-                UPDATE generated_resumes
-                SET resume_content = ?,
-                    created_at = CURRENT_TIMESTAMP
+        # TRANSACTION FIX: Use single transaction for both operations
+        with self._write() as conn:
+            # Save the current content to history (in same transaction);
+            # copied inside SQLite so it never round-trips through Python
+            conn.execute("""
+                INSERT INTO resume_versions (resume_id, content, version_notes)
+                SELECT id, resume_content, ?
+                FROM generated_resumes
                 WHERE id = ?
-            """, (new_content, resume_id))
+            """, ("Auto-saved before edit", resume_id))
 
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise  # Re-raise to notify caller
-        finally:
-            conn.close()
+            # Update the resume content
+            conn.execute(_SQL_UPDATE_RESUME_CONTENT, (_pack(new_content), resume_id))
+            # created_at changed; the cache is keyed by job, not resume id
+            self._resume_exists.clear()
 
     def create_resume_version(self, resume_id, content, version_notes=""):
         """Create a new version of a resume for history tracking"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self._write() as conn:
+            cursor = conn.execute("""
+                INSERT INTO resume_versions (resume_id, content, version_notes)
+                VALUES (?, ?, ?)
+            """, (resume_id, _pack(content), version_notes))
 
-        cursor.execute("""
-            INSERT INTO resume_versions (resume_id, content, version_notes)
-            VALUES (?, ?, ?)
-        """, (resume_id, content, version_notes))
-
-        conn.commit()
-        version_id = cursor.lastrowid
-        conn.close()
+            version_id = cursor.lastrowid
 
         return version_id
 
     def get_resume_versions(self, resume_id, limit=10):
         """Get version history for a resume"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, content, version_notes, created_at
-            FROM resume_versions
-            WHERE resume_id = ?
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (resume_id, limit))
+        return list(self.iter_resume_versions(resume_id, limit))
 
-        results = cursor.fetchall()
-        conn.close()
+    def iter_resume_versions(self, resume_id, limit=10):
+        """Stream version history for a resume, newest first"""
+        versions = _iter_dicts(self._reader().execute("""
+            SELECT
+                v.id,
+                v.content,
+                v.version_notes,
+                datetime(v.created_at, 'unixepoch') AS created_at
+            FROM resume_versions v
+            WHERE v.resume_id = ?
+            ORDER BY v.created_at DESC
+            LIMIT ?
+        """, (resume_id, limit)))
 
-        return [{
-            "id": row[0],
-            "content": row[1],
-            "version_notes": row[2],
-            "created_at": row[3]
-        } for row in results]
+        for version in versions:
+            version["content"] = _unpack(version["content"])
+            yield version
 
     def get_resume_by_id(self, resume_id):
         """Get resume by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT
                 r.id,
                 r.job_description_id,
                 r.resume_content,
                 r.ats_score,
                 r.file_path,
-                r.created_at,
+                datetime(r.created_at, 'unixepoch') AS created_at,
                 j.company_name,
                 j.job_title
             FROM generated_resumes r
@@ -370,68 +835,141 @@ class Database:
         """, (resume_id,))
 
         result = cursor.fetchone()
-        conn.close()
 
         if result:
-            return {
-                "id": result[0],
-                "job_description_id": result[1],
-                "resume_content": result[2],
-                "ats_score": result[3],
-                "file_path": result[4],
-                "created_at": result[5],
-                "company_name": result[6],
-                "job_title": result[7]
-            }
+            resume = dict(result)
+            resume["resume_content"] = _unpack(resume["resume_content"])
+            return resume
         return None
 
     def update_resume_score(self, resume_id, new_score):
         """Update ATS score after editing"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE generated_resumes
-            SET ats_score = ?
-            WHERE id = ?
-        """, (new_score, resume_id))
-
-        conn.commit()
-        conn.close()
+        with self._write() as conn:
+            conn.execute("""
+                UPDATE generated_resumes
+                SET ats_score = ?
+                WHERE id = ?
+            """, (new_score, resume_id))
 
     def _migrate_scoring_fields(self):
         """
         Migrate database to add new scoring fields.
+
+        Completion is recorded in PRAGMA user_version, so an already
+        migrated database only pays for one pragma read at startup.
         Safe to run multiple times - only adds columns if they don't exist.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        # Check if new columns exist
-        cursor.execute("PRAGMA table_info(generated_resumes)")
-        columns = [col[1] for col in cursor.fetchall()]
-
-        # Add new scoring columns if they don't exist
-        new_columns = {
-            'ats_grade': 'TEXT',
-            'ats_color': 'TEXT',
-            'score_breakdown': 'TEXT',  # JSON field
-            'pass_probability': 'REAL'
-        }
-
-        for col_name, col_type in new_columns.items():
-            if col_name not in columns:
-                try:
-                    cursor.execute(f"""
-                        ALTER TABLE generated_resumes
-                        ADD COLUMN {col_name} {col_type}
-                    """)
-                    conn.commit()
-                except sqlite3.OperationalError:
-                    # Column might already exist in another process
-                    pass
-
-        conn.close()
+        with self._lock:
+            conn = self._conn()
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION_SCORING_FIELDS:
+                return
+
+            conn.execute("BEGIN EXCLUSIVE")
+            try:
+                # Check which of the new columns exist (older databases may
+                # have been partially migrated before user_version was used)
+                columns = {col[1] for col in conn.execute("PRAGMA table_info(generated_resumes)")}
+
+                # Add new scoring columns if they don't exist
+                new_columns = {
+                    'ats_grade': 'TEXT',
+                    'ats_color': 'TEXT',
+                    'score_breakdown': 'TEXT',  # JSON field
+                    'pass_probability': 'REAL'
+                }
+
+                for col_name, col_type in new_columns.items():
+                    if col_name not in columns:
+                        conn.execute(f"""
+                            ALTER TABLE generated_resumes
+                            ADD COLUMN {col_name} {col_type}
+                        """)
+
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_SCORING_FIELDS}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _migrate_unix_timestamps(self):
+        """
+        Migrate created_at columns from ISO text to unix seconds.
+
+        See _migrate_created_at; OptimizedDatabase runs the same conversion
+        on the files it opens. Completion is recorded in PRAGMA user_version.
+        """
+        with self._lock:
+            conn = self._conn()
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION_UNIX_TIMESTAMPS:
+                return
+
+            conn.execute("BEGIN EXCLUSIVE")
+            try:
+                _migrate_created_at(conn)
+
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_UNIX_TIMESTAMPS}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _migrate_real_ats_score(self):
+        """
+        Rebuild a STRICT generated_resumes table declaring ats_score INTEGER.
+
+        STRICT INTEGER columns reject fractional scores such as 87.5. Plain
+        tables are left alone, since INTEGER affinity already stores those
+        as REAL. Completion is recorded in PRAGMA user_version.
+        """
+        with self._lock:
+            conn = self._conn()
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION_REAL_ATS_SCORE:
+                return
+
+            conn.execute("BEGIN EXCLUSIVE")
+            try:
+                row = conn.execute("""
+                    SELECT sql FROM sqlite_master
+                    WHERE type = 'table' AND name = 'generated_resumes'
+                """).fetchone()
+
+                if row and row[0].rstrip().upper().endswith("STRICT"):
+                    new_sql, replaced = _STRICT_INTEGER_ATS_SCORE.subn("ats_score REAL", row[0])
+                    if replaced:
+                        _rebuild_table(conn, "generated_resumes", new_sql)
+
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_REAL_ATS_SCORE}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _migrate_job_description_hash(self):
+        """
+        Move job description deduplication onto job_description_hash.
+
+        See _migrate_jd_hash; OptimizedDatabase runs the same step on the
+        files it opens. Completion is recorded in PRAGMA
+        user_version.
+        """
+        with self._lock:
+            conn = self._conn()
+
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION_JOB_DESCRIPTION_HASH:
+                return
+
+            conn.execute("BEGIN EXCLUSIVE")
+            try:
+                _migrate_jd_hash(conn)
+
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_JOB_DESCRIPTION_HASH}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
     def insert_generated_resume_with_score(
         self,
@@ -454,25 +992,20 @@ class Database:
                 - category_scores: Detailed breakdown
                 - pass_probability: Estimated pass rate
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
         # Extract score data
         if score_data:
-            ats_score = int(score_data.get('score', 0))
-            ats_grade = score_data.get('grade', 'N/A')
-            ats_color = score_data.get('color', 'red')
-            pass_probability = score_data.get('pass_probability', 0.0)
-            score_breakdown = json.dumps(score_data.get('category_scores', {}))
+            score = {**_DEFAULT_SCORE, **score_data}
+            ats_score = int(score['score'])
+            ats_grade = score['grade']
+            ats_color = score['color']
+            pass_probability = score['pass_probability']
+            score_breakdown = _json_dumps(score['category_scores'])
         else:
-            ats_score = None
-            ats_grade = None
-            ats_color = None
-            pass_probability = None
-            score_breakdown = None
+            ats_score = ats_grade = ats_color = pass_probability = score_breakdown = None
 
-        try:
-            cursor.execute("""
+        # Insert, or update the existing resume for this job
+        with self._write() as conn:
+            resume_id = conn.execute("""
                 INSERT INTO generated_resumes (
                     job_description_id,
                     resume_content,
@@ -484,47 +1017,27 @@ class Database:
                     pass_probability
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    resume_content = excluded.resume_content,
+                    file_path = excluded.file_path,
+                    ats_score = excluded.ats_score,
+                    ats_grade = excluded.ats_grade,
+                    ats_color = excluded.ats_color,
+                    score_breakdown = excluded.score_breakdown,
+                    pass_probability = excluded.pass_probability
+                RETURNING id
             """, (
                 job_description_id,
-                resume_content,
+                _pack(resume_content),
                 file_path,
                 ats_score,
                 ats_grade,
                 ats_color,
                 score_breakdown,
                 pass_probability
-            ))
-            conn.commit()
-            resume_id = cursor.lastrowid
-        except sqlite3.IntegrityError:
-            # Resume already exists, update it
-            cursor.execute("""
-                UPDATE generated_resumes
-                SET resume_content = ?,
-                    file_path = ?,
-                    ats_score = ?,
-                    ats_grade = ?,
-                    ats_color = ?,
-                    score_breakdown = ?,
-                    pass_probability = ?
-                WHERE job_description_id = ?
-            """, (
-                resume_content,
-                file_path,
-                ats_score,
-                ats_grade,
-                ats_color,
-                score_breakdown,
-                pass_probability,
-                job_description_id
-            ))
-            conn.commit()
-            cursor.execute("""
-                SELECT id FROM generated_resumes WHERE job_description_id = ?
-            """, (job_description_id,))
-            resume_id = cursor.fetchone()[0]
+            )).fetchone()[0]
+            self._resume_exists.pop(job_description_id, None)
 
-        conn.close()
         return resume_id
 
     def get_resume_score_details(self, resume_id):
@@ -534,10 +1047,7 @@ class Database:
         Returns:
             Dict with score, grade, color, breakdown, and pass probability
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        cursor = self._reader().execute("""
             SELECT
                 ats_score,
                 ats_grade,
@@ -549,25 +1059,52 @@ class Database:
         """, (resume_id,))
 
         result = cursor.fetchone()
-        conn.close()
 
         if result:
-            score_breakdown = None
-            if result[3]:
-                try:
-                    score_breakdown = json.loads(result[3])
-                except json.JSONDecodeError:
-                    score_breakdown = None
-
             return {
                 'ats_score': result[0],
                 'ats_grade': result[1],
                 'ats_color': result[2],
-                'score_breakdown': score_breakdown,
+                'score_breakdown': _parse_breakdown(result[3]),
                 'pass_probability': result[4]
             }
         return None
 
+    def get_resume_full(self, resume_id):
+        """
+        Get a resume together with its job info and ATS score details.
+
+        Returns the keys of get_resume_by_id() and get_resume_score_details()
+        from a single query, for pages that need both.
+        """
+        cursor = self._reader().execute("""
+            SELECT
+                r.id,
+                r.job_description_id,
+                r.resume_content,
+                r.ats_score,
+                r.file_path,
+                datetime(r.created_at, 'unixepoch') AS created_at,
+                r.ats_grade,
+                r.ats_color,
+                r.score_breakdown,
+                r.pass_probability,
+                j.company_name,
+                j.job_title
+            FROM generated_resumes r
+            JOIN job_descriptions j ON r.job_description_id = j.id
+            WHERE r.id = ?
+        """, (resume_id,))
+
+        result = cursor.fetchone()
+
+        if result:
+            resume = dict(result)
+            resume["resume_content"] = _unpack(resume["resume_content"])
+            resume["score_breakdown"] = _parse_breakdown(resume["score_breakdown"])
+            return resume
+        return None
+
     def get_score_history(self, job_description_id=None, limit=10):
         """
         Get ATS score history, optionally filtered by job description.
@@ -575,53 +1112,24 @@ class Database:
         Returns:
             List of score records with trend analysis
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_score_history(job_description_id, limit))
+
+    def iter_score_history(self, job_description_id=None, limit=10):
+        """
+        Stream ATS score history, optionally filtered by job description.
+
+        Yields:
+            Score records, newest first, including score_delta (change
+            from the previous score for the same company) and
+            score_avg_5 (moving average of the last five scores)
+        """
+        conn = self._reader()
 
         if job_description_id:
-            cursor.execute("""
-                SELECT
-                    r.id,
-                    r.ats_score,
-                    r.ats_grade,
-                    r.ats_color,
-                    r.pass_probability,
-                    r.created_at,
-                    j.company_name,
-                    j.job_title
-                FROM generated_resumes r
-                JOIN job_descriptions j ON r.job_description_id = j.id
-                WHERE r.job_description_id = ?
-                ORDER BY r.created_at DESC
-                LIMIT ?
-            """, (job_description_id, limit))
+            cursor = conn.execute(
+                _SQL_SCORE_HISTORY_FOR_JOB, (job_description_id, limit)
+            )
         else:
-            cursor.execute("""
-                SELECT
-                    r.id,
-                    r.ats_score,
-                    r.ats_grade,
-                    r.ats_color,
-                    r.pass_probability,
-                    r.created_at,
-                    j.company_name,
-                    j.job_title
-                FROM generated_resumes r
-                JOIN job_descriptions j ON r.job_description_id = j.id
-                ORDER BY r.created_at DESC
-                LIMIT ?
-            """, (limit,))
-
-        results = cursor.fetchall()
-        conn.close()
-
-        return [{
-            'id': row[0],
-            'ats_score': row[1],
-            'ats_grade': row[2],
-            'ats_color': row[3],
-            'pass_probability': row[4],
-            'created_at': row[5],
-            'company_name': row[6],
-            'job_title': row[7]
-        } for row in results]
+            cursor = conn.execute(_SQL_SCORE_HISTORY, (limit,))
+
+        return _iter_dicts(cursor)
@@ -11,10 +11,17 @@ This is the optimized version of the database layer with:
 """
 import sqlite3
 import json
+import functools
+import logging
+import os
+import random
+import threading
 import time  # SECURITY FIX: Missing import for retry logic with exponential backoff
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
 
 
 # P1-8 FIX: Helper function to check if a database error is retryable
@@ -47,8 +54,164 @@ def _is_retryable_db_error(error: Exception) -> bool:
 
     return any(pattern in error_msg for pattern in retryable_patterns)
 
+
+def with_db_retry(max_retries: int = 2, base_delay: float = 0.1):
+    """
+    Decorator that retries a database write on transient errors
+
+    Lock contention is already waited out inside SQLite by the pool's
+    busy_timeout, so this only covers the errors left over after that
+    (see _is_retryable_db_error). The delay doubles on each attempt with
+    +/-50% jitter so concurrent writers don't retry in lockstep. Retries
+    are counted on the instance's monitor when it has one.
+
+    Args:
+        max_retries: Retries after the first attempt
+        base_delay: Delay before the first retry, in seconds
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if not _is_retryable_db_error(e) or attempt == max_retries:
+                        # Max retries exceeded or non-retryable error
+                        raise
+                    delay = base_delay * 2 ** attempt * random.uniform(0.5, 1.5)
+                    monitor = getattr(args[0], 'monitor', None) if args else None
+                    if monitor is not None:
+                        monitor.record_retry(func.__name__)
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning("Retryable db error %s, retrying in %.2fs", e, delay)
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """
+    Fetch all rows from a cursor as dictionaries
+
+    The cursor must return plain tuples (row_factory = None): column names
+    are read from cursor.description once and zipped with each row, which
+    is cheaper than going through sqlite3.Row for every row.
+    """
+    keys = [column[0] for column in cursor.description]
+    return [dict(zip(keys, row)) for row in cursor.fetchall()]
+
+
+def _iter_dicts(cursor: sqlite3.Cursor) -> Iterator[Dict]:
+    """
+    Yield rows from a tuple-returning cursor as dictionaries
+
+    Rows are pulled FETCH_BATCH_SIZE at a time, so only one batch is
+    materialized at once instead of the full result set.
+    """
+    keys = [column[0] for column in cursor.description]
+    while True:
+        batch = cursor.fetchmany(FETCH_BATCH_SIZE)
+        if not batch:
+            return
+        for row in batch:
+            yield dict(zip(keys, row))
+
+
+def _pop_window_total(rows: List[Dict]) -> Optional[int]:
+    """
+    Remove the COUNT(*) OVER () 'total' column from paginated rows
+
+    Returns:
+        The total row count, or None when there are no rows to carry it
+    """
+    total = rows[0]['total'] if rows else None
+    for row in rows:
+        del row['total']
+    return total
+
+
+# Cache key prefix and namespaces for the get_statistics counts; the
+# namespace versions are appended so any write orphans the entry
+_STATS_CACHE_KEY = "stats:counts"
+_STATS_NAMESPACES = ('job', 'resume', 'cover_letter', 'company_research')
+_STATS_CACHE_TTL = 30
+
+# Database files whose schema init_database() has already created in this
+# process, keyed by (resolved path, device, inode) so a file that is
+# deleted and recreated at the same path is initialized again
+_SCHEMA_READY: set = set()
+_SCHEMA_LOCK = threading.Lock()
+
+# Page and fallback-count SQL for the paginated getters, keyed by whether
+# the optional filter is set. Built once so each filter combination is a
+# fixed string that sqlite3's statement cache finds on every call.
+# COUNT(*) OVER () adds the filtered, unpaginated total to every row.
+_SQL_JOBS_PAGE = {
+    filtered: (
+        f"""
+            SELECT id, company_name, job_title, job_url,
+                datetime(created_at, 'unixepoch') AS created_at,
+                COUNT(*) OVER () AS total
+            FROM job_descriptions{where}
+            ORDER BY job_descriptions.created_at DESC LIMIT ? OFFSET ?
+        """,
+        f"SELECT COUNT(*) as count FROM job_descriptions{where}"
+    )
+    for filtered, where in ((False, ""), (True, " WHERE company_name LIKE ?"))
+}
+_SQL_RESUMES_PAGE = {
+    filtered: (
+        f"""
+            SELECT
+                r.id,
+                r.ats_score,
+                r.file_path,
+                datetime(r.created_at, 'unixepoch') AS created_at,
+                j.company_name,
+                j.job_title,
+                COUNT(*) OVER () AS total
+            FROM generated_resumes r
+            INNER JOIN job_descriptions j ON r.job_description_id = j.id{where}
+            ORDER BY r.created_at DESC LIMIT ? OFFSET ?
+        """,
+        f"SELECT COUNT(*) as count FROM generated_resumes r{where}"
+    )
+    for filtered, where in ((False, ""), (True, " WHERE r.ats_score >= ?"))
+}
+
+# Rows pulled per fetchmany() call when streaming result sets
+FETCH_BATCH_SIZE = 64
+
+# Keywords per INSERT statement in _insert_keywords; two parameters each
+# keeps a statement under the 999-variable limit of older SQLite builds
+KEYWORD_INSERT_BATCH = 400
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_insert_sql(row_count: int) -> str:
+    """
+    Build the multi-row keyword INSERT for row_count keywords
+
+    Cached so each batch size always maps to the same SQL string object,
+    which sqlite3's per-connection statement cache then finds without
+    re-preparing or re-hashing the text.
+    """
+    return f"""
+        INSERT INTO keywords (job_description_id, keyword)
+        VALUES {", ".join(["(?, ?)"] * row_count)}
+        ON CONFLICT(job_description_id, keyword)
+        DO UPDATE SET frequency = frequency + 1
+    """
+
 from .pool import SingletonPool
-from .cache import DatabaseCache, cached_query, invalidate_on_write
+from .cache import DatabaseCache
+# Storage formats shared with schema.Database, which uses the same tables:
+# large text columns may be zstd BLOBs, created_at holds unix seconds and
+# job descriptions are deduplicated on job_description_hash
+from .schema import (
+    _SQL_NOW, _job_description_hash, _migrate_created_at, _migrate_jd_hash, _unpack
+)
 from .performance import QueryPerformanceMonitor, monitor_query_performance
 
 
@@ -83,13 +246,29 @@ class OptimizedDatabase:
         """
         self.db_path = db_path
 
-        # Initialize connection pool
-        self.pool = SingletonPool.get_pool(
+        # Initialize connection pools: writes share a single connection, so
+        # writers in this process queue on the pool rather than contend for
+        # SQLite's write lock; reads use query_only connections that run
+        # alongside the writer under WAL
+        self.pool_w = SingletonPool.get_pool(
+            db_path=db_path,
+            pool_size=1,
+            max_overflow=0,
+            timeout=30.0
+        )
+        self.pool_r = SingletonPool.get_pool(
             db_path=db_path,
             pool_size=pool_size,
             max_overflow=10,
-            timeout=30.0
+            timeout=30.0,
+            query_only=True
         )
+        # The read pool serves most traffic; kept as .pool for its stats
+        self.pool = self.pool_r
+
+        # Whether the keywords table (created by migration 002) exists;
+        # probed once below, see reload_schema_flags()
+        self._has_keywords_table = False
 
         # Initialize cache
         self.cache = DatabaseCache(max_size=cache_size, default_ttl=cache_ttl)
@@ -97,16 +276,73 @@ class OptimizedDatabase:
         # Initialize performance monitor
         self.monitor = QueryPerformanceMonitor(slow_query_threshold_ms=100.0)
 
-        # Initialize database schema
-        self.init_database()
+        # Initialize database schema (once per database file per process)
+        self._ensure_schema()
+        self.reload_schema_flags()
+
+    def _schema_key(self) -> Optional[tuple]:
+        """Identify the database file for _SCHEMA_READY, or None if in-memory"""
+        if self.db_path == ":memory:":
+            return None
+        path = Path(self.db_path).resolve()
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (str(path), st.st_dev, st.st_ino)
+
+    def _ensure_schema(self):
+        """Run init_database() unless this process already has for the file"""
+        key = self._schema_key()
+        if key is not None and key in _SCHEMA_READY:
+            return
+
+        with _SCHEMA_LOCK:
+            if key is not None and key in _SCHEMA_READY:
+                return
+            self.init_database()
+            # The file exists now even if it didn't before init_database
+            key = self._schema_key()
+            if key is not None:
+                _SCHEMA_READY.add(key)
+
+    def reload_schema_flags(self):
+        """
+        Re-probe optional tables added by migrations
+
+        Called on construction; call again after running migrations
+        against a database this instance already has open.
+        """
+        with self._read() as conn:
+            self._has_keywords_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='keywords'"
+            ).fetchone() is not None
+
+    def _read(self):
+        """Check out a connection from the read-only pool"""
+        return self.pool_r.get_connection()
+
+    def _write(self):
+        """Check out the write connection"""
+        return self.pool_w.get_connection()
+
+    def _bump_version(self, namespace: str):
+        """
+        Invalidate cached reads of a namespace in O(1)
+
+        Call once the write has committed: bumping earlier lets a concurrent
+        reader cache the pre-commit rows under the new version key.
+        """
+        if self.cache:
+            self.cache.bump_version(namespace)
 
     def init_database(self):
         """Initialize database schema"""
-        with self.pool.get_connection() as conn:
+        with self._write() as conn:
             cursor = conn.cursor()
 
             # Job descriptions table
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS job_descriptions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     company_name TEXT NOT NULL,
@@ -114,57 +350,94 @@ class OptimizedDatabase:
                     job_description TEXT NOT NULL,
                     job_url TEXT,
                     keywords TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(company_name, job_description)
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
+                    job_description_hash BLOB
                 )
             """)
 
+            # Duplicate detection on a 32-byte hash instead of the full
+            # text; also adds and backfills the hash on older tables
+            cursor.execute("BEGIN IMMEDIATE")
+            with conn:
+                _migrate_jd_hash(conn)
+
             # Generated resumes table
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS generated_resumes (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     job_description_id INTEGER NOT NULL,
                     resume_content TEXT NOT NULL,
                     ats_score INTEGER,
                     file_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
                     FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
                     UNIQUE(job_description_id)
                 )
             """)
 
             # Company research cache (from Perplexity)
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS company_research (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     company_name TEXT UNIQUE NOT NULL,
                     research_data TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at INTEGER DEFAULT ({_SQL_NOW})
                 )
             """)
 
             # Generated cover letters table
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS generated_cover_letters (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     job_description_id INTEGER NOT NULL,
                     resume_id INTEGER,
                     cover_letter_content TEXT NOT NULL,
                     file_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_at INTEGER DEFAULT ({_SQL_NOW}),
                     FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
                     FOREIGN KEY (resume_id) REFERENCES generated_resumes(id),
                     UNIQUE(job_description_id)
                 )
             """)
 
-            conn.commit()
+            # Tables created with ISO text timestamps (by either layer):
+            # convert them to unix seconds before anything reads them. The
+            # rebuild drops tables other rows reference, so foreign keys
+            # (on for pool connections) are off while it runs.
+            cursor.execute("PRAGMA foreign_keys = OFF")
+            try:
+                cursor.execute("BEGIN IMMEDIATE")
+                with conn:
+                    _migrate_created_at(conn)
+            finally:
+                cursor.execute("PRAGMA foreign_keys = ON")
+
+            # Indexes for the list and pagination queries. Names match
+            # migrations/001_add_indexes.sql so the migration doesn't
+            # duplicate them. Lookups by job_description_id are already
+            # served by the UNIQUE autoindexes, and company_filter's
+            # LIKE '%x%' can't use an index, so neither gets one here.
+            for index_sql in (
+                "CREATE INDEX IF NOT EXISTS idx_job_created ON job_descriptions(created_at DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_resume_created ON generated_resumes(created_at DESC)",
+                "CREATE INDEX IF NOT EXISTS idx_resume_score_created "
+                "ON generated_resumes(ats_score, created_at DESC)",
+            ):
+                cursor.execute(index_sql)
+
+            # Refresh planner statistics where they are missing or stale;
+            # cheaper than a full ANALYZE on every construction
+            try:
+                cursor.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass  # Not supported in restricted environment
 
     # ============================================================================
     # JOB DESCRIPTIONS - OPTIMIZED
     # ============================================================================
 
     @monitor_query_performance()
+    @with_db_retry()
     def insert_job_description(
         self,
         company_name: str,
@@ -186,59 +459,60 @@ class OptimizedDatabase:
         Returns:
             Job ID
         """
-        # Invalidate cache on write
-        if self.cache:
-            self.cache.invalidate('job')
-
         # Convert keywords list to JSON string for storage
         keywords_str = json.dumps(keywords) if keywords else None
 
-        # Retry logic with exponential backoff for database lock issues
-        max_retries = 5
-        retry_delay = 0.1  # Start with 100ms
+        job_description_hash = _job_description_hash(job_description)
 
-        for attempt in range(max_retries):
+        with self._write() as conn:
+            cursor = conn.cursor()
+
+            # Use BEGIN IMMEDIATE for write transactions to acquire lock immediately
+            cursor.execute("BEGIN IMMEDIATE")
             try:
-                with self.pool.get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    try:
-                        # Use BEGIN IMMEDIATE for write transactions to acquire lock immediately
-                        cursor.execute("BEGIN IMMEDIATE")
-                        cursor.execute("""
-                            INSERT INTO job_descriptions (company_name, job_title, job_description, job_url, keywords)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (company_name, job_title, job_description, job_url, keywords_str))
-                        job_id = cursor.lastrowid
-
-                        # Insert keywords into normalized table if it exists
-                        if keywords:
-                            self._insert_keywords(cursor, job_id, keywords)
-
-                        conn.commit()
-
-                    except sqlite3.IntegrityError:
-                        # Job description already exists
-                        conn.rollback()
-                        cursor.execute("""
+                # An existing job is left alone and looked up through idx_jd_hash
+                # in the same transaction, so there's no rollback to recover from
+                row = cursor.execute("""
+                    INSERT INTO job_descriptions
+                        (company_name, job_title, job_description, job_url, keywords, job_description_hash)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT DO NOTHING
+                    RETURNING id
+                """, (company_name, job_title, job_description, job_url, keywords_str,
+                      job_description_hash)).fetchone()
+
+                if row is not None:
+                    job_id = row[0]
+
+                    # Insert keywords into normalized table if it exists
+                    if keywords:
+                        self._insert_keywords(cursor, job_id, keywords)
+                else:
+                    # Job description already exists
+                    row = cursor.execute("""
+                        SELECT id FROM job_descriptions
+                        WHERE company_name = ? AND job_description_hash = ?
+                    """, (company_name, job_description_hash)).fetchone()
+                    if row is None:
+                        # Written without a hash (by code predating it), so
+                        # only the text UNIQUE constraint matched
+                        row = cursor.execute("""
                             SELECT id FROM job_descriptions
                             WHERE company_name = ? AND job_description = ?
-                        """, (company_name, job_description))
-                        job_id = cursor.fetchone()[0]
-
-                    return job_id
-
-            except sqlite3.OperationalError as e:
-                # P1-8 FIX: Broadened retry logic to catch more transient errors
-                if _is_retryable_db_error(e) and attempt < max_retries - 1:
-                    # Wait with exponential backoff before retrying
-                    print(f"Retryable database error ({str(e)[:50]}), retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Double the delay for next attempt
-                    continue
-                else:
-                    # Max retries exceeded or non-retryable error
-                    raise
+                        """, (company_name, job_description)).fetchone()
+                        cursor.execute(
+                            "UPDATE job_descriptions SET job_description_hash = ? WHERE id = ?",
+                            (job_description_hash, row[0])
+                        )
+                    job_id = row[0]
+
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+        self._bump_version('job')
+        return job_id
 
     def _insert_keywords(self, cursor, job_id: int, keywords: List[str]) -> None:
         """
@@ -249,27 +523,22 @@ class OptimizedDatabase:
             job_id: Job description ID
             keywords: List of keywords
         """
-        # Check if keywords table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='keywords'
-        """)
+        keywords = [keyword.strip() for keyword in keywords if keyword.strip()]
+        if not keywords:
+            return
 
-        if not cursor.fetchone():
+        if not self._has_keywords_table:
             return  # Keywords table doesn't exist yet
 
-        # Insert each keyword
-        for keyword in keywords:
-            if keyword.strip():
-                try:
-                    cursor.execute("""
-                        INSERT INTO keywords (job_description_id, keyword)
-                        VALUES (?, ?)
-                        ON CONFLICT(job_description_id, keyword)
-                        DO UPDATE SET frequency = frequency + 1
-                    """, (job_id, keyword.strip()))
-                except sqlite3.Error:
-                    pass  # Ignore conflicts
+        # Insert keywords with one multi-row statement per batch; a repeated
+        # keyword hits the conflict clause against the row inserted before it
+        for start in range(0, len(keywords), KEYWORD_INSERT_BATCH):
+            batch = keywords[start:start + KEYWORD_INSERT_BATCH]
+            params = [value for keyword in batch for value in (job_id, keyword)]
+            try:
+                cursor.execute(_keyword_insert_sql(len(batch)), params)
+            except sqlite3.Error:
+                pass  # Keyword indexing is best-effort
 
     @monitor_query_performance()
     def get_job_by_id(self, job_id: int) -> Optional[Dict]:
@@ -282,10 +551,11 @@ class OptimizedDatabase:
         Returns:
             Job dictionary or None
         """
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT id, company_name, job_title, job_description, job_url, keywords, created_at
+                SELECT id, company_name, job_title, job_description, job_url, keywords,
+                    datetime(created_at, 'unixepoch') AS created_at
                 FROM job_descriptions
                 WHERE id = ?
             """, (job_id,))
@@ -306,16 +576,18 @@ class OptimizedDatabase:
         Returns:
             List of job dictionaries
         """
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute("""
-                SELECT id, company_name, job_title, job_url, created_at
+                SELECT id, company_name, job_title, job_url,
+                    datetime(created_at, 'unixepoch') AS created_at
                 FROM job_descriptions
-                ORDER BY created_at DESC
+                ORDER BY job_descriptions.created_at DESC
                 LIMIT ?
             """, (limit,))
 
-            return [dict(row) for row in cursor.fetchall()]
+            return _rows_to_dicts(cursor)
 
     @monitor_query_performance()
     def get_jobs_paginated(
@@ -337,33 +609,22 @@ class OptimizedDatabase:
         """
         offset = (page - 1) * page_size
 
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
 
-            # Build query with optional filter
-            query = """
-                SELECT id, company_name, job_title, job_url, created_at
-                FROM job_descriptions
-            """
-            count_query = "SELECT COUNT(*) as count FROM job_descriptions"
-            params = []
-
-            if company_filter:
-                query += " WHERE company_name LIKE ?"
-                count_query += " WHERE company_name LIKE ?"
-                params.append(f"%{company_filter}%")
-
-            query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-            params.extend([page_size, offset])
+            query, count_query = _SQL_JOBS_PAGE[bool(company_filter)]
+            filter_params = [f"%{company_filter}%"] if company_filter else []
 
             # Get jobs
-            cursor.execute(query, params)
-            jobs = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(query, filter_params + [page_size, offset])
+            jobs = _rows_to_dicts(cursor)
+            total = _pop_window_total(jobs)
 
-            # Get total count
-            count_params = [f"%{company_filter}%"] if company_filter else []
-            cursor.execute(count_query, count_params)
-            total = cursor.fetchone()['count']
+            # A page past the end has no rows to carry the total
+            if total is None:
+                cursor.execute(count_query, filter_params)
+                total = cursor.fetchone()[0]
 
             return {
                 'jobs': jobs,
@@ -388,10 +649,10 @@ class OptimizedDatabase:
         Returns:
             Resume info dictionary or None
         """
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT id, file_path, created_at
+                SELECT id, file_path, datetime(created_at, 'unixepoch') AS created_at
                 FROM generated_resumes
                 WHERE job_description_id = ?
             """, (job_description_id,))
@@ -402,6 +663,7 @@ class OptimizedDatabase:
             return None
 
     @monitor_query_performance()
+    @with_db_retry()
     def insert_generated_resume(
         self,
         job_description_id: int,
@@ -421,80 +683,47 @@ class OptimizedDatabase:
         Returns:
             Resume ID
         """
-        # Invalidate cache
-        if self.cache:
-            self.cache.invalidate('resume')
-
-        # Retry logic with exponential backoff for database lock issues
-        max_retries = 5
-        retry_delay = 0.1  # Start with 100ms
-
-        for attempt in range(max_retries):
-            try:
-                with self.pool.get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    try:
-                        # Use BEGIN IMMEDIATE for write transactions to acquire lock immediately
-                        cursor.execute("BEGIN IMMEDIATE")
-                        cursor.execute("""
-                            INSERT INTO generated_resumes (job_description_id, resume_content, file_path, ats_score)
-                            VALUES (?, ?, ?, ?)
-                        """, (job_description_id, resume_content, file_path, ats_score))
-                        resume_id = cursor.lastrowid
-                        conn.commit()
-                    except sqlite3.IntegrityError:
-                        # Resume already exists, update it
-                        conn.rollback()
-                        cursor.execute("BEGIN IMMEDIATE")
-                        cursor.execute("""
-                            UPDATE generated_resumes
-                            SET resume_content = ?, file_path = ?, ats_score = ?
-                            WHERE job_description_id = ?
-                        """, (resume_content, file_path, ats_score, job_description_id))
-                        cursor.execute("""
-                            SELECT id FROM generated_resumes WHERE job_description_id = ?
-                        """, (job_description_id,))
-                        resume_id = cursor.fetchone()[0]
-                        conn.commit()
-
-                    return resume_id
-
-            except sqlite3.OperationalError as e:
-                # P1-8 FIX: Broadened retry logic to catch more transient errors
-                if _is_retryable_db_error(e) and attempt < max_retries - 1:
-                    # Wait with exponential backoff before retrying
-                    print(f"Retryable database error ({str(e)[:50]}), retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Double the delay for next attempt
-                    continue
-                else:
-                    # Max retries exceeded or non-retryable error
-                    raise
-
-    @monitor_query_performance()
-    def get_all_resumes(self, limit: int = 100) -> List[Dict]:
+        with self._write() as conn:
+            # Insert, or update the existing resume for this job, in
+            # one statement; RETURNING gives the id on both paths
+            resume_id = conn.execute("""
+                INSERT INTO generated_resumes (job_description_id, resume_content, file_path, ats_score)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    resume_content = excluded.resume_content,
+                    file_path = excluded.file_path,
+                    ats_score = excluded.ats_score
+                RETURNING id
+            """, (job_description_id, resume_content, file_path, ats_score)).fetchone()[0]
+
+        self._bump_version('resume')
+        return resume_id
+
+    def iter_all_resumes(self, limit: int = 100) -> Iterator[Dict]:
         """
-        Get all generated resumes with job info (OPTIMIZED - single query with JOIN)
+        Stream generated resumes with job info, newest first
 
-        This eliminates the N+1 query problem by using a JOIN
+        Rows are fetched FETCH_BATCH_SIZE at a time, so resume bodies are
+        never all held in memory at once. A read connection stays checked
+        out until the generator is exhausted or closed.
 
         Args:
-            limit: Maximum number of resumes to return
+            limit: Maximum number of resumes to yield
 
-        Returns:
-            List of resume dictionaries with job info
+        Yields:
+            Resume dictionaries with job info
         """
         try:
-            with self.pool.get_connection() as conn:
+            with self._read() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = None
                 cursor.execute("""
                     SELECT
                         r.id,
                         r.resume_content,
                         r.ats_score,
                         r.file_path,
-                        r.created_at,
+                        datetime(r.created_at, 'unixepoch') AS created_at,
                         j.id as job_id,
                         j.company_name,
                         j.job_title,
@@ -505,12 +734,29 @@ class OptimizedDatabase:
                     LIMIT ?
                 """, (limit,))
 
-                return [dict(row) for row in cursor.fetchall()]
+                for resume in _iter_dicts(cursor):
+                    resume['resume_content'] = _unpack(resume['resume_content'])
+                    yield resume
         except Exception as e:
             # Handle pysqlite3 compatibility issues on Streamlit Cloud
-            # Return empty list if tables don't exist or query fails
+            # Stop quietly if tables don't exist or query fails
             print(f"Warning: Failed to get resumes: {e}")
-            return []
+
+    @monitor_query_performance()
+    def get_all_resumes(self, limit: int = 100) -> List[Dict]:
+        """
+        Get all generated resumes with job info (OPTIMIZED - single query with JOIN)
+
+        This eliminates the N+1 query problem by using a JOIN. Use
+        iter_all_resumes() when the rows don't need to be held as a list.
+
+        Args:
+            limit: Maximum number of resumes to return
+
+        Returns:
+            List of resume dictionaries with job info
+        """
+        return list(self.iter_all_resumes(limit))
 
     @monitor_query_performance()
     def update_resume_content(self, resume_id: int, content: str) -> bool:
@@ -524,56 +770,38 @@ class OptimizedDatabase:
         Returns:
             True on success, False on failure
         """
-        # Invalidate cache on write
-        if self.cache:
-            self.cache.invalidate('resume')
-
-        # Retry logic with exponential backoff for database lock issues
-        max_retries = 5
-        retry_delay = 0.1  # Start with 100ms
-
-        for attempt in range(max_retries):
-            try:
-                with self.pool.get_connection() as conn:
-                    cursor = conn.cursor()
-
-                    # Use BEGIN IMMEDIATE for write transactions to acquire lock immediately
-                    cursor.execute("BEGIN IMMEDIATE")
-                    cursor.execute("""
-                        UPDATE generated_resumes
-                        SET resume_content = ?
-                        WHERE id = ?
-                    """, (content, resume_id))
-
-                    rows_affected = cursor.rowcount
-                    conn.commit()
-
-                    # Log the update operation
-                    if rows_affected > 0:
-                        print(f"Successfully updated resume ID {resume_id} with {len(content)} characters")
-                        return True
-                    else:
-                        print(f"Warning: No resume found with ID {resume_id}")
-                        return False
-
-            except sqlite3.OperationalError as e:
-                # Retry logic for transient database errors
-                if _is_retryable_db_error(e) and attempt < max_retries - 1:
-                    print(f"Retryable database error ({str(e)[:50]}), retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Double the delay for next attempt
-                    continue
-                else:
-                    # Max retries exceeded or non-retryable error
-                    print(f"Error updating resume content: {e}")
-                    return False
-            except Exception as e:
-                # Catch any other exceptions
-                print(f"Error updating resume content: {e}")
-                return False
-
-        # If we exhausted all retries
-        return False
+        try:
+            rows_affected = self._update_resume_content(resume_id, content)
+        except Exception as e:
+            # Max retries exceeded or non-retryable error
+            print(f"Error updating resume content: {e}")
+            return False
+
+        self._bump_version('resume')
+
+        # Log the update operation
+        if rows_affected > 0:
+            print(f"Successfully updated resume ID {resume_id} with {len(content)} characters")
+            return True
+        else:
+            print(f"Warning: No resume found with ID {resume_id}")
+            return False
+
+    @with_db_retry()
+    def _update_resume_content(self, resume_id: int, content: str) -> int:
+        """Write new resume content, returning the number of rows updated"""
+        with self._write() as conn:
+            # Use BEGIN IMMEDIATE for write transactions to acquire lock immediately;
+            # the connection context manager commits, or rolls back on error
+            conn.execute("BEGIN IMMEDIATE")
+            with conn:
+                cursor = conn.execute("""
+                    UPDATE generated_resumes
+                    SET resume_content = ?
+                    WHERE id = ?
+                """, (content, resume_id))
+
+            return cursor.rowcount
 
     @monitor_query_performance()
     def get_resumes_paginated(
@@ -595,43 +823,22 @@ class OptimizedDatabase:
         """
         offset = (page - 1) * page_size
 
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
 
-            # Build query with optional filter
-            query = """
-                SELECT
-                    r.id,
-                    r.ats_score,
-                    r.file_path,
-                    r.created_at,
-                    j.company_name,
-                    j.job_title
-                FROM generated_resumes r
-                INNER JOIN job_descriptions j ON r.job_description_id = j.id
-            """
-            count_query = """
-                SELECT COUNT(*) as count FROM generated_resumes r
-            """
-            params = []
-
-            if min_ats_score is not None:
-                where_clause = " WHERE r.ats_score >= ?"
-                query += where_clause
-                count_query += where_clause
-                params.append(min_ats_score)
-
-            query += " ORDER BY r.created_at DESC LIMIT ? OFFSET ?"
-            params.extend([page_size, offset])
+            query, count_query = _SQL_RESUMES_PAGE[min_ats_score is not None]
+            filter_params = [min_ats_score] if min_ats_score is not None else []
 
             # Get resumes
-            cursor.execute(query, params)
-            resumes = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(query, filter_params + [page_size, offset])
+            resumes = _rows_to_dicts(cursor)
+            total = _pop_window_total(resumes)
 
-            # Get total count
-            count_params = [min_ats_score] if min_ats_score is not None else []
-            cursor.execute(count_query, count_params)
-            total = cursor.fetchone()['count']
+            # A page past the end has no rows to carry the total
+            if total is None:
+                cursor.execute(count_query, filter_params)
+                total = cursor.fetchone()[0]
 
             return {
                 'resumes': resumes,
@@ -656,7 +863,7 @@ class OptimizedDatabase:
         Returns:
             Research data or None
         """
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT research_data FROM company_research
@@ -664,7 +871,7 @@ class OptimizedDatabase:
             """, (company_name,))
 
             row = cursor.fetchone()
-            return row['research_data'] if row else None
+            return _unpack(row['research_data']) if row else None
 
     @monitor_query_performance()
     def save_company_research(self, company_name: str, research_data: str) -> None:
@@ -675,17 +882,18 @@ class OptimizedDatabase:
             company_name: Company name
             research_data: Research data to cache
         """
-        # Invalidate cache
-        if self.cache:
-            self.cache.invalidate('company_research')
-
-        with self.pool.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO company_research (company_name, research_data)
+        # UPSERT updates the row in place; INSERT OR REPLACE would delete
+        # and re-insert it under a new id
+        with self._write() as conn:
+            conn.execute(f"""
+                INSERT INTO company_research (company_name, research_data)
                 VALUES (?, ?)
+                ON CONFLICT(company_name) DO UPDATE SET
+                    research_data = excluded.research_data,
+                    created_at = {_SQL_NOW}
             """, (company_name, research_data))
-            conn.commit()
+
+        self._bump_version('company_research')
 
     # ============================================================================
     # COVER LETTERS - OPTIMIZED
@@ -702,10 +910,10 @@ class OptimizedDatabase:
         Returns:
             Cover letter info dictionary or None
         """
-        with self.pool.get_connection() as conn:
+        with self._read() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT id, file_path, created_at
+                SELECT id, file_path, datetime(created_at, 'unixepoch') AS created_at
                 FROM generated_cover_letters
                 WHERE job_description_id = ?
             """, (job_description_id,))
@@ -735,34 +943,20 @@ class OptimizedDatabase:
         Returns:
             Cover letter ID
         """
-        # Invalidate cache
-        if self.cache:
-            self.cache.invalidate('cover_letter')
-
-        with self.pool.get_connection() as conn:
-            cursor = conn.cursor()
-
-            try:
-                cursor.execute("""
-                    INSERT INTO generated_cover_letters (job_description_id, resume_id, cover_letter_content, file_path)
-                    VALUES (?, ?, ?, ?)
-                """, (job_description_id, resume_id, cover_letter_content, file_path))
-                conn.commit()
-                cover_letter_id = cursor.lastrowid
-            except sqlite3.IntegrityError:
-                # Cover letter already exists, update it
-                cursor.execute("""
-                    UPDATE generated_cover_letters
-                    SET cover_letter_content = ?, file_path = ?, resume_id = ?
-                    WHERE job_description_id = ?
-                """, (cover_letter_content, file_path, resume_id, job_description_id))
-                conn.commit()
-                cursor.execute("""
-                    SELECT id FROM generated_cover_letters WHERE job_description_id = ?
-                """, (job_description_id,))
-                cover_letter_id = cursor.fetchone()[0]
-
-            return cover_letter_id
+        with self._write() as conn:
+            # Insert, or update the existing cover letter for this job
+            cover_letter_id = conn.execute("""
+                INSERT INTO generated_cover_letters (job_description_id, resume_id, cover_letter_content, file_path)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_description_id) DO UPDATE SET
+                    cover_letter_content = excluded.cover_letter_content,
+                    file_path = excluded.file_path,
+                    resume_id = excluded.resume_id
+                RETURNING id
+            """, (job_description_id, resume_id, cover_letter_content, file_path)).fetchone()[0]
+
+        self._bump_version('cover_letter')
+        return cover_letter_id
 
     # ============================================================================
     # ANALYTICS & STATISTICS
@@ -775,39 +969,46 @@ class OptimizedDatabase:
         Returns:
             Dictionary with database statistics
         """
-        with self.pool.get_connection() as conn:
-            cursor = conn.cursor()
-
-            stats = {}
-
-            # Count tables
-            cursor.execute("SELECT COUNT(*) as count FROM job_descriptions")
-            stats['total_jobs'] = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM generated_resumes")
-            stats['total_resumes'] = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM generated_cover_letters")
-            stats['total_cover_letters'] = cursor.fetchone()['count']
+        stats_key = None
+        if self.cache:
+            stats_key = f"{_STATS_CACHE_KEY}:{self.cache.version_key(*_STATS_NAMESPACES)}"
+        counts = self.cache.get(stats_key) if stats_key else None
 
-            cursor.execute("SELECT COUNT(*) as count FROM company_research")
-            stats['cached_companies'] = cursor.fetchone()['count']
+        if counts is None:
+            with self._read() as conn:
+                # Table counts and average ATS score in one statement
+                row = conn.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM job_descriptions),
+                        (SELECT COUNT(*) FROM generated_resumes),
+                        (SELECT COUNT(*) FROM generated_cover_letters),
+                        (SELECT COUNT(*) FROM company_research),
+                        (SELECT AVG(ats_score) FROM generated_resumes WHERE ats_score IS NOT NULL)
+                """).fetchone()
+
+            counts = {
+                'total_jobs': row[0],
+                'total_resumes': row[1],
+                'total_cover_letters': row[2],
+                'cached_companies': row[3],
+                'average_ats_score': round(row[4], 2) if row[4] else None
+            }
+            if self.cache:
+                self.cache.set(stats_key, counts, ttl_seconds=_STATS_CACHE_TTL)
 
-            # Average ATS score
-            cursor.execute("SELECT AVG(ats_score) as avg_score FROM generated_resumes WHERE ats_score IS NOT NULL")
-            avg_score = cursor.fetchone()['avg_score']
-            stats['average_ats_score'] = round(avg_score, 2) if avg_score else None
+        stats = dict(counts)
 
-            # Get cache stats
-            stats['cache'] = self.cache.get_stats()
+        # Get cache stats
+        stats['cache'] = self.cache.get_stats()
 
-            # Get pool stats
-            stats['pool'] = self.pool.get_stats()
+        # Get pool stats
+        stats['pool'] = self.pool_r.get_stats()
+        stats['write_pool'] = self.pool_w.get_stats()
 
-            # Get performance stats
-            stats['performance'] = self.monitor.get_stats()
+        # Get performance stats
+        stats['performance'] = self.monitor.get_stats()
 
-            return stats
+        return stats
 
     def print_statistics(self) -> None:
         """Print formatted database statistics"""
@@ -827,7 +1028,8 @@ class OptimizedDatabase:
         self.cache.print_stats()
 
         # Print pool stats
-        self.pool.print_stats()
+        self.pool_r.print_stats()
+        self.pool_w.print_stats()
 
         # Print performance stats
         self.monitor.print_stats()
@@ -2,30 +2,203 @@
 Cover Letter Generator using Kimi K2 API with cover letter knowledge
 """
 import os
+import re
 import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from pathlib import Path
 
 # Import Kimi client
-from src.clients.kimi_client import KimiK2Client
+from src.clients.kimi_client import get_shared_kimi_client
+
+# tiktoken is optional: when its encoding can be loaded, prompt sections
+# are truncated to a token budget; otherwise a chars-per-token estimate
+# is used. Its cl100k encoding only approximates Kimi's tokenizer either way.
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 load_dotenv()
 
+# Static prompt text, sent as the system message ahead of the knowledge
+# base. Keeping it byte-identical across requests lets the API reuse its
+# cached prefix; everything specific to the candidate or job goes in the
+# user message after it.
+_PREAMBLE = "You are an expert cover letter writer with deep knowledge of modern cover letter best practices, storytelling, and professional communication."
+
+_INSTRUCTIONS = """# Cover Letter Generation Instructions
+
+## Critical Requirements:
+
+1. **Format & Structure**:
+   - Professional business letter format
+   - Include: Date, Hiring Manager/Company Address, Greeting, 3-4 Body Paragraphs, Closing
+   - Length: 250-400 words (3-4 paragraphs max)
+   - Use proper business letter spacing
+
+2. **Opening Paragraph (Hook)**:
+   - Attention-grabbing first sentence
+   - State the position clearly
+   - Briefly mention your strongest qualification or achievement
+   - Show enthusiasm for the role
+
+3. **Body Paragraphs (Value Proposition)**:
+   - Paragraph 2: Tell a compelling story that demonstrates relevant skills
+   - Paragraph 3: Connect your experience to company needs
+   - Use specific examples with quantifiable results
+   - Show you understand the company and role
+   - Demonstrate cultural fit
+
+4. **Closing Paragraph (Call to Action)**:
+   - Express enthusiasm
+   - Reference availability for interview
+   - Thank them for consideration
+   - Professional sign-off
+
+5. **Writing Style**:
+   - Professional yet personable tone
+   - Active voice, strong action verbs
+   - Specific and concrete (avoid generic statements)
+   - Show personality while maintaining professionalism
+   - No clichés or overused phrases
+   - Natural keyword integration
+
+6. **Content Strategy**:
+   - DO NOT simply repeat the resume
+   - Add context, storytelling, and personality
+   - Explain WHY you're interested in this company specifically
+   - Demonstrate you've researched the company
+   - Address how you can solve their specific challenges
+   - Show passion for the role/industry
+
+## Output Format (FOLLOW THIS EXACT STRUCTURE):
+
+[Date]
+
+[Your Name]
+[Street Address
+City, State, Zip]
+[Phone Number]
+[Email]
+[LinkedIn profile and/or website address]
+
+[Hiring Manager Name]
+[Title]
+[Company Name]
+[Company Address
+City, State, Zip]
+
+Dear [Hiring Manager Name],
+
+[First Paragraph - Introduction]
+In one to three sentences, explain why you are writing and mention the specific position you are applying for. Highlight the main experience or qualification you have that would make you ideal for this job.
+
+[Middle Paragraph(s) - Your Value Proposition]
+This is where you sell yourself. Focus on recent achievements and use strong verbs to describe your skills. Explain how your skills and qualifications will make you a valuable asset to the company. Use specific examples with quantifiable results.
+
+[Closing Paragraph]
+Thank the reader for their time and attention. Reiterate your interest and enthusiasm about the position. Mention that you look forward to hearing from them shortly.
+
+Thank you,
+[Your Full Name]
+
+---
+
+**IMPORTANT OUTPUT REQUIREMENTS**:
+- Generate ONLY the cover letter in the format above
+- Do NOT include any notes, tips, or commentary
+- Do NOT add explanatory text before or after
+- Output should be pure cover letter content only
+- Use the candidate's actual name and contact information from their profile
+- Use today's date
+"""
+
+# Trailing notes/tips sections the model sometimes appends; everything
+# from the first match to the end of the text is dropped
+_NOTES_RE = re.compile(
+    r'\n\s*#+\s*Notes.*$|\n\s*#+\s*Tips.*$|\n\s*---+\s*\n\s*\*\*.*Notes.*$',
+    re.MULTILINE | re.DOTALL
+)
+
+# job_analysis fields already spelled out in the prompt, left out of the
+# "Full Job Analysis" JSON
+_SURFACED_JOB_FIELDS = frozenset({
+    "company_name", "job_title", "keywords", "required_skills", "key_responsibilities"
+})
+
+# Characters of the knowledge base included in the prompt
+KNOWLEDGE_MAX_CHARS = 15000
+
+# Token budgets for the variable parts of the prompt
+PROFILE_MAX_TOKENS = 4000
+RESUME_SUMMARY_MAX_TOKENS = 300
+
+# Fallback estimate when tiktoken isn't usable
+_CHARS_PER_TOKEN = 4
+
+# Concurrent API requests in generate_cover_letters_batch
+BATCH_MAX_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _load_kb(path, mtime):
+    """
+    Read the knowledge base, truncated to KNOWLEDGE_MAX_CHARS
+
+    Cached per (path, mtime) so generators share one read of the file
+    until it is edited.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read(KNOWLEDGE_MAX_CHARS)
+
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    """The cl100k encoding, or None if tiktoken is missing or can't load it"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None  # Encoding file not cached and not downloadable
+
+
+def _truncate_tokens(text, max_tokens):
+    """
+    Truncate text to roughly max_tokens tokens
+
+    Returns:
+        (text, truncated) - truncated is True if anything was cut
+    """
+    encoding = _token_encoding()
+    if encoding is None:
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        return text[:max_chars], len(text) > max_chars
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max_tokens]), True
+
+
 class CoverLetterGenerator:
     def __init__(self, knowledge_path="coverletter_knowledge_base.md"):
-        self.client = KimiK2Client(api_key=os.getenv("KIMI_API_KEY"))
+        # Shared across instances so the HTTP connection pool is reused
+        self.client = get_shared_kimi_client(os.getenv("KIMI_API_KEY"))
         self.coverletter_knowledge = self._load_coverletter_knowledge(knowledge_path)
 
     def _load_coverletter_knowledge(self, knowledge_path):
         """Load cover letter knowledge base"""
         try:
-            with open(knowledge_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_kb(knowledge_path, os.path.getmtime(knowledge_path))
         except Exception as e:
             print(f"Warning: Could not load cover letter knowledge: {e}")
             return ""
 
-    def generate_cover_letter(self, profile_text, job_analysis, company_research=None, resume_content=None):
+    def generate_cover_letter(self, profile_text, job_analysis, company_research=None, resume_content=None, on_text=None):
         """
         Generate professional cover letter using Claude
 
@@ -34,23 +207,24 @@ class CoverLetterGenerator:
             job_analysis: Analyzed job description (from JobAnalyzer)
             company_research: Optional company research from Perplexity
             resume_content: Optional - the generated resume for alignment
+            on_text: Optional callback invoked with each chunk of text as
+                it streams in (e.g. to show a live preview)
 
         Returns:
             dict with 'content' (markdown/text cover letter) and 'success' status
         """
 
         # Build the prompt
-        prompt = self._build_coverletter_prompt(profile_text, job_analysis, company_research, resume_content)
+        messages = self._build_coverletter_prompt(profile_text, job_analysis, company_research, resume_content)
 
         try:
             print("Generating professional cover letter with Kimi K2...")
 
-            result = self.client.chat_completion(
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+            result = self.client.chat_completion_stream(
+                messages=messages,
                 temperature=0.7,
-                max_tokens=8000
+                max_tokens=8000,
+                on_text=on_text
             )
 
             # Check if API call was successful
@@ -75,25 +249,41 @@ class CoverLetterGenerator:
                 "error": str(e)
             }
 
-    def _clean_cover_letter_output(self, text):
-        """Remove any notes or commentary from the cover letter"""
-        import re
+    def generate_cover_letters_batch(self, jobs, max_workers=BATCH_MAX_WORKERS):
+        """
+        Generate cover letters for several jobs concurrently
 
-        # Remove common patterns
-        patterns_to_remove = [
-            r'\n\s*#+\s*Notes.*$',
-            r'\n\s*#+\s*Tips.*$',
-            r'\n\s*---+\s*\n\s*\*\*.*Notes.*$',
-        ]
+        Every request shares the same system prefix, so after the first one
+        the API can serve that part from its prompt cache.
 
-        cleaned = text
-        for pattern in patterns_to_remove:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE | re.DOTALL)
+        Args:
+            jobs: List of dicts of generate_cover_letter keyword arguments
+                (profile_text, job_analysis, and optionally company_research
+                and resume_content)
+            max_workers: Maximum requests in flight at once
 
-        return cleaned.strip()
+        Returns:
+            List of generate_cover_letter results, in the order of jobs
+        """
+        if not jobs:
+            return []
+
+        print(f"Generating {len(jobs)} cover letters with Kimi K2...")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.generate_cover_letter(**job), jobs))
+
+    def _clean_cover_letter_output(self, text):
+        """Remove any notes or commentary from the cover letter"""
+        return _NOTES_RE.sub('', text).strip()
 
     def _build_coverletter_prompt(self, profile_text, job_analysis, company_research=None, resume_content=None):
-        """Build comprehensive prompt for Claude"""
+        """
+        Build the chat messages for the cover letter request
+
+        The system message (instructions and knowledge base) is the same for
+        every request, so it forms a cacheable prefix; the user message
+        carries the candidate and job details.
+        """
 
         company_name = job_analysis.get("company_name", "the company")
         job_title = job_analysis.get("job_title", "the position")
@@ -101,6 +291,15 @@ class CoverLetterGenerator:
         required_skills = job_analysis.get("required_skills", [])
         responsibilities = job_analysis.get("key_responsibilities", [])
 
+        # Remaining analysis as compact JSON with sorted keys, so the same
+        # job always produces the same bytes
+        other_analysis = json.dumps(
+            {k: v for k, v in job_analysis.items() if k not in _SURFACED_JOB_FIELDS},
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False
+        )
+
         # Build company research section
         company_section = ""
         if company_research:
@@ -112,21 +311,29 @@ class CoverLetterGenerator:
         # Build resume context if available
         resume_section = ""
         if resume_content:
+            resume_summary, _ = _truncate_tokens(resume_content, RESUME_SUMMARY_MAX_TOKENS)
             resume_section = f"""
 ## Generated Resume Context
 The candidate has already created a resume for this position. Please ensure the cover letter complements (not repeats) the resume and highlights different aspects or adds storytelling context.
 
-Resume Summary (first 500 chars):
-{resume_content[:500]}...
+Resume Summary (opening of the resume):
+{resume_summary}...
 """
 
-        prompt = f"""You are an expert cover letter writer with deep knowledge of modern cover letter best practices, storytelling, and professional communication.
+        # Keep the prompt size bounded for unusually long profiles
+        profile_text, truncated = _truncate_tokens(profile_text, PROFILE_MAX_TOKENS)
+        if truncated:
+            print(f"Note: profile truncated to {PROFILE_MAX_TOKENS} tokens for the cover letter prompt")
 
-# Your Task
-Create a compelling, professional cover letter for {company_name} - {job_title} position that will capture the hiring manager's attention and complement the candidate's resume.
+        system_prompt = f"""{_PREAMBLE}
 
 # Cover Letter Writing Knowledge Base
-{self.coverletter_knowledge[:15000]}
+{self.coverletter_knowledge}
+
+{_INSTRUCTIONS}"""
+
+        user_prompt = f"""# Your Task
+Create a compelling, professional cover letter for {company_name} - {job_title} position that will capture the hiring manager's attention and complement the candidate's resume.
 
 # Candidate Profile
 {profile_text}
@@ -139,102 +346,20 @@ Key Responsibilities: {', '.join(responsibilities[:5]) if responsibilities else
 Key Keywords: {', '.join(keywords[:20]) if keywords else 'Extract from job description'}
 
 Full Job Analysis:
-{json.dumps(job_analysis, indent=2)}
+{other_analysis}
 
 {company_section}
 
 {resume_section}
 
-# Cover Letter Generation Instructions
-
-## Critical Requirements:
-
-1. **Format & Structure**:
-   - Professional business letter format
-   - Include: Date, Hiring Manager/Company Address, Greeting, 3-4 Body Paragraphs, Closing
-   - Length: 250-400 words (3-4 paragraphs max)
-   - Use proper business letter spacing
-
-2. **Opening Paragraph (Hook)**:
-   - Attention-grabbing first sentence
-   - State the position clearly
-   - Briefly mention your strongest qualification or achievement
-   - Show enthusiasm for the role
-
-3. **Body Paragraphs (Value Proposition)**:
-   - Paragraph 2: Tell a compelling story that demonstrates relevant skills
-   - Paragraph 3: Connect your experience to company needs
-   - Use specific examples with quantifiable results
-   - Show you understand the company and role
-   - Demonstrate cultural fit
-
-4. **Closing Paragraph (Call to Action)**:
-   - Express enthusiasm
-   - Reference availability for interview
-   - Thank them for consideration
-   - Professional sign-off
-
-5. **Writing Style**:
-   - Professional yet personable tone
-   - Active voice, strong action verbs
-   - Specific and concrete (avoid generic statements)
-   - Show personality while maintaining professionalism
-   - No clichés or overused phrases
-   - Natural keyword integration
-
-6. **Content Strategy**:
-   - DO NOT simply repeat the resume
-   - Add context, storytelling, and personality
-   - Explain WHY you're interested in this company specifically
-   - Demonstrate you've researched the company
-   - Address how you can solve their specific challenges
-   - Show passion for the role/industry
-
-## Output Format (FOLLOW THIS EXACT STRUCTURE):
-
-[Date]
-
-[Your Name]
-[Street Address
-City, State, Zip]
-[Phone Number]
-[Email]
-[LinkedIn profile and/or website address]
-
-[Hiring Manager Name]
-[Title]
-[Company Name]
-[Company Address
-City, State, Zip]
-
-Dear [Hiring Manager Name],
-
-[First Paragraph - Introduction]
-In one to three sentences, explain why you are writing and mention the specific position you are applying for. Highlight the main experience or qualification you have that would make you ideal for this job.
-
-[Middle Paragraph(s) - Your Value Proposition]
-This is where you sell yourself. Focus on recent achievements and use strong verbs to describe your skills. Explain how your skills and qualifications will make you a valuable asset to the company. Use specific examples with quantifiable results.
-
-[Closing Paragraph]
-Thank the reader for their time and attention. Reiterate your interest and enthusiasm about the position. Mention that you look forward to hearing from them shortly.
-
-Thank you,
-[Your Full Name]
-
----
-
-**IMPORTANT OUTPUT REQUIREMENTS**:
-- Generate ONLY the cover letter in the format above
-- Do NOT include any notes, tips, or commentary
-- Do NOT add explanatory text before or after
-- Output should be pure cover letter content only
-- Use the candidate's actual name and contact information from their profile
-- Use today's date
-- Be specific to {company_name} and the {job_title} role
+Be specific to {company_name} and the {job_title} role.
 
 Generate the professional cover letter now (cover letter only, no additional notes):"""
 
-        return prompt
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
 
 def main():
     """Test cover letter generator"""
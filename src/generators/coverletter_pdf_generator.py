@@ -6,12 +6,158 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_LEFT, TA_JUSTIFY
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer
 from reportlab.lib.colors import HexColor
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import io
 import re
 
 
+# Background workers for generate_pdf_async
+_PDF_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="coverletter-pdf")
+
+# Page margin and vertical gaps used in the letter layout. Only the heights
+# are shared: each gap needs its own Spacer, because ReportLab marks a
+# flowable it pushes to the next page, raises LayoutError if the same
+# object is pushed again, and sets attributes on flowables while wrapping
+# them (unsafe with generate_pdf_async building documents in parallel)
+_MARGIN = 1*inch
+_GAP_GREETING = 0.1*inch
+_GAP_PARAGRAPH = 0.15*inch
+_GAP_SECTION = 0.2*inch
+_GAP_SIGNATURE = 0.5*inch
+
+
+class _LetterTemplate(BaseDocTemplate):
+    """
+    Letter-size template with one frame inside the standard margins
+
+    Replaces SimpleDocTemplate, which rebuilds its page templates in every
+    build() call. The Frame is created per document: frames track the
+    layout position while a document builds, so they can't be shared.
+    """
+
+    def __init__(self, target):
+        super().__init__(
+            target,
+            pagesize=letter,
+            rightMargin=_MARGIN,
+            leftMargin=_MARGIN,
+            topMargin=_MARGIN,
+            bottomMargin=_MARGIN
+        )
+        frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+        self.addPageTemplates([PageTemplate(id='Letter', frames=[frame], pagesize=letter)])
+
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+
+# The same filter as a str.translate table for ASCII names (the common case)
+_UNSAFE_ASCII_TABLE = {c: None for c in range(128) if _UNSAFE_FILENAME_RE.match(chr(c))}
+
+
+def _safe_filename_part(name):
+    """Drop characters unsafe in a filename and turn spaces into underscores"""
+    if name.isascii():
+        name = name.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        name = _UNSAFE_FILENAME_RE.sub('', name)
+    return name.strip().replace(' ', '_')
+
+
+# Words that mark the start of the recipient block. Legal suffixes must be
+# whole words so sender lines like "Principal Engineer" don't match "inc"
+_RECIPIENT_KEYWORDS = r'hiring manager|company|\b(?:inc|llc|corp|corporation|incorporated)\b'
+
+# Classifies a stripped, non-empty letter line in one match; the first
+# alternative that matches at the start of the line names its kind
+_LINE_CLASSIFIER = re.compile(
+    r'(?P<date>\d{1,2}/\d{1,2}/\d{4}|[A-Z][a-z]+ \d{1,2}, \d{4})'
+    r'|(?P<closing>(?:Thank you|Sincerely|Best regards|Regards),$)'
+    r'|(?P<contact>(?i:.*(?:@|linkedin|github|portfolio)))'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}$)'
+    rf'|(?P<recipient>(?i:.*(?:{_RECIPIENT_KEYWORDS})))'
+)
+
+# Profile URLs (any case) and bare LinkedIn/GitHub/Portfolio words in a
+# contact line, rewritten to links in one pass by _format_contact_line
+_CONTACT_RE = re.compile(
+    r'(?P<linkedin_url>(?i:linkedin\.com/in/[\w-]+))'
+    r'|(?P<github_url>(?i:github\.com/[\w-]+))'
+    r'|(?P<portfolio_url>(?i:nagavenkatasai7\.github\.io/[\w/-]*))'
+    r'|(?P<linkedin>LinkedIn)|(?P<github>GitHub)|(?P<portfolio>Portfolio)'
+)
+
+# Link label per match kind, and the fixed URL for a bare word
+_CONTACT_LABELS = {
+    'linkedin_url': 'LinkedIn', 'linkedin': 'LinkedIn',
+    'github_url': 'GitHub', 'github': 'GitHub',
+    'portfolio_url': 'Portfolio', 'portfolio': 'Portfolio',
+}
+_CONTACT_DEFAULT_URLS = {
+    'linkedin': 'https://linkedin.com/in/naga-venkata-sai-chennu',
+    'github': 'https://github.com/nagavenkatasai7',
+    'portfolio': 'https://nagavenkatasai7.github.io/portfolio/',
+}
+
+# A bare word is left alone when the line also has that kind of URL
+_CONTACT_URL_MARKERS = {
+    'linkedin': 'linkedin.com/in/',
+    'github': 'github.com/',
+    'portfolio': 'nagavenkatasai7.github.io',
+}
+
+def _classify_line(line):
+    """
+    Classify a stripped letter line
+
+    Returns:
+        One of 'blank', 'greeting', 'date', 'closing', 'contact', 'phone',
+        'recipient' or 'body'
+    """
+    if not line:
+        return 'blank'
+    if line.startswith('Dear'):
+        return 'greeting'
+    match = _LINE_CLASSIFIER.match(line)
+    return match.lastgroup if match else 'body'
+
+
+@lru_cache(maxsize=1)
+def _letter_styles():
+    """
+    Create custom styles for professional business letter
+
+    Built on first use and shared by every generator in the process.
+    """
+    styles = getSampleStyleSheet()
+
+    # Header style (sender contact info)
+    styles.add(ParagraphStyle(
+        name='header',
+        parent=styles['Normal'],
+        fontSize=11,
+        leading=14,
+        alignment=TA_LEFT,
+        spaceAfter=2,
+        textColor=HexColor('#000000')
+    ))
+
+    # Body style (all letter content)
+    styles.add(ParagraphStyle(
+        name='body',
+        parent=styles['Normal'],
+        fontSize=11,
+        leading=16,
+        alignment=TA_LEFT,
+        textColor=HexColor('#000000'),
+        spaceAfter=0
+    ))
+
+    return styles
+
+
 class CoverLetterPDFGenerator:
     def __init__(self, output_dir="generated_coverletters"):
         self.output_dir = Path(output_dir)
@@ -29,208 +175,163 @@ class CoverLetterPDFGenerator:
         Returns:
             str: Path to generated PDF file
         """
-        # Create filename
-        safe_company = re.sub(r'[^\w\s-]', '', company_name).strip().replace(' ', '_')
-        safe_job = re.sub(r'[^\w\s-]', '', job_title).strip().replace(' ', '_')
+        story = self._build_story(cover_letter_text)
+        return self._write_pdf(story, self._output_path(company_name, job_title))
+
+    def generate_pdf_async(self, cover_letter_text, company_name, job_title):
+        """
+        Generate the PDF on a background thread
+
+        The letter is parsed on the calling thread; only the ReportLab
+        build and file write run in the background, so the caller can
+        start on the next letter meanwhile.
+
+        Args:
+            cover_letter_text: The cover letter content (markdown/text)
+            company_name: Company name for filename
+            job_title: Job title for filename
+
+        Returns:
+            Future resolving to the generate_pdf result
+        """
+        story = self._build_story(cover_letter_text)
+        return _PDF_POOL.submit(self._write_pdf, story, self._output_path(company_name, job_title))
+
+    def _output_path(self, company_name, job_title):
+        """PDF path for a company and job title"""
+        safe_company = _safe_filename_part(company_name)
+        safe_job = _safe_filename_part(job_title)
         filename = f"{safe_company}_{safe_job}_CoverLetter.pdf"
-        output_path = self.output_dir / filename
+        return self.output_dir / filename
 
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=letter,
-            rightMargin=1*inch,
-            leftMargin=1*inch,
-            topMargin=1*inch,
-            bottomMargin=1*inch
+    def _build_story(self, cover_letter_text):
+        """Lay out the cover letter text as a list of ReportLab flowables"""
+        story = []
+        styles = _letter_styles()
+
+        # Parse and add content: classify every line once, then locate the
+        # date and the greeting after it; the lines between them are the
+        # sender and recipient header, everything else is letter body
+        lines = [line.strip() for line in cover_letter_text.strip().split('\n')]
+        kinds = [_classify_line(line) for line in lines]
+        line_count = len(lines)
+
+        date_idx = next((i for i, kind in enumerate(kinds) if kind == 'date'), line_count)
+        greeting_idx = next(
+            (i for i in range(date_idx + 1, line_count) if kinds[i] == 'greeting'), line_count
         )
 
-        # Build story (content)
-        story = []
-        styles = self._create_styles()
-
-        # Parse and add content
-        lines = cover_letter_text.strip().split('\n')
-
-        in_date_section = True
-        in_sender_section = False
-        in_recipient_section = False
-        paragraph_buffer = []
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Skip empty lines initially, use them as paragraph separators later
-            if not stripped:
-                # If we have buffered paragraph text, add it
-                if paragraph_buffer:
-                    para_text = ' '.join(paragraph_buffer)
-                    story.append(Paragraph(para_text, styles['body']))
-                    story.append(Spacer(1, 0.15*inch))
-                    paragraph_buffer = []
-                continue
-
-            # Date line (first line)
-            if in_date_section and (re.match(r'\d{1,2}/\d{1,2}/\d{4}', stripped) or re.match(r'[A-Z][a-z]+ \d{1,2}, \d{4}', stripped)):
-                story.append(Paragraph(stripped, styles['body']))
-                story.append(Spacer(1, 0.2*inch))  # Space after date
-                in_date_section = False
-                in_sender_section = True
-                continue
-
-            # Sender section (name, address, phone, email, LinkedIn)
-            if in_sender_section:
-                if stripped.startswith('Dear'):
-                    # End of sender + recipient, start of greeting
-                    in_sender_section = False
-                    story.append(Spacer(1, 0.1*inch))
+        paragraph_buffer = []  # Lines of the body paragraph being read
+        saw_closing = False  # The next text line is the signature name
+
+        def flush_paragraph():
+            story.append(Paragraph(' '.join(paragraph_buffer), styles['body']))
+            paragraph_buffer.clear()
+
+        def end_paragraph():
+            # Empty lines are paragraph separators
+            if paragraph_buffer:
+                flush_paragraph()
+                story.append(Spacer(1, _GAP_PARAGRAPH))
+
+        def add_body(start, stop):
+            nonlocal saw_closing
+            for stripped, kind in zip(lines[start:stop], kinds[start:stop]):
+                if kind == 'blank':
+                    end_paragraph()
+                elif kind == 'closing':
+                    # Closing section (template uses "Thank you,")
+                    if paragraph_buffer:
+                        flush_paragraph()
+                    story.append(Spacer(1, _GAP_SECTION))
+                    story.append(Paragraph(stripped, styles['body']))
+                    story.append(Spacer(1, _GAP_SIGNATURE))  # Space for signature
+                    saw_closing = True
+                elif saw_closing:
+                    # Final signature name
                     story.append(Paragraph(stripped, styles['body']))
-                    story.append(Spacer(1, 0.15*inch))
-                    continue
-                elif not any(char in stripped for char in ['@', 'linkedin', 'github', 'portfolio']) and \
-                     not re.match(r'^\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}$', stripped):
-                    # Check if this might be recipient section (company name after sender info)
-                    # Look for patterns like company names, titles (Hiring Manager, etc.)
-                    if any(keyword in stripped.lower() for keyword in ['hiring manager', 'company', 'inc', 'llc', 'corp']):
-                        in_sender_section = False
-                        in_recipient_section = True
-                        story.append(Spacer(1, 0.2*inch))  # Space between sender and recipient
-                        story.append(Paragraph(stripped, styles['body']))
-                        continue
-
-                # Sender contact info lines
-                if '@' in stripped or 'linkedin' in stripped.lower() or 'github' in stripped.lower() or 'portfolio' in stripped.lower():
+                    saw_closing = False
+                else:
+                    # Regular body paragraph text, accumulated into paragraphs
+                    paragraph_buffer.append(stripped)
+
+        # Anything before the date line is treated as body text
+        add_body(0, date_idx)
+
+        if date_idx < line_count:
+            story.append(Paragraph(lines[date_idx], styles['body']))
+            story.append(Spacer(1, _GAP_SECTION))  # Space after date
+
+            # Sender (name, address, phone, email, LinkedIn), then recipient
+            in_recipient = False
+            recipient_buffer = []  # Recipient address lines, one Paragraph per block
+
+            def flush_recipient():
+                if recipient_buffer:
+                    story.append(Paragraph('<br/>'.join(recipient_buffer), styles['body']))
+                    recipient_buffer.clear()
+
+            for stripped, kind in zip(lines[date_idx + 1:greeting_idx], kinds[date_idx + 1:greeting_idx]):
+                if kind == 'blank':
+                    flush_recipient()
+                    end_paragraph()
+                elif in_recipient:
+                    # Recipient address lines
+                    recipient_buffer.append(stripped)
+                elif kind == 'recipient':
+                    # Company names and titles (Hiring Manager, etc.) start
+                    # the recipient section
+                    in_recipient = True
+                    story.append(Spacer(1, _GAP_SECTION))  # Space between sender and recipient
+                    recipient_buffer.append(stripped)
+                elif kind == 'contact':
+                    # Sender contact info lines
                     formatted_line = self._format_contact_line(stripped)
                     story.append(Paragraph(formatted_line, styles['header']))
                 else:
                     story.append(Paragraph(stripped, styles['header']))
-                continue
+            flush_recipient()
 
-            # Recipient section (before greeting)
-            if in_recipient_section:
-                if stripped.startswith('Dear'):
-                    in_recipient_section = False
-                    story.append(Spacer(1, 0.1*inch))
-                    story.append(Paragraph(stripped, styles['body']))
-                    story.append(Spacer(1, 0.15*inch))
-                else:
-                    # Recipient address lines
-                    story.append(Paragraph(stripped, styles['body']))
-                continue
-
-            # Closing section (template uses "Thank you,")
-            if stripped in ['Thank you,', 'Sincerely,', 'Best regards,', 'Regards,']:
-                # Flush any remaining paragraph
-                if paragraph_buffer:
-                    para_text = ' '.join(paragraph_buffer)
-                    story.append(Paragraph(para_text, styles['body']))
-                    paragraph_buffer = []
-
-                story.append(Spacer(1, 0.2*inch))
-                story.append(Paragraph(stripped, styles['body']))
-                story.append(Spacer(1, 0.5*inch))  # Space for signature
-                continue
-
-            # Final signature name
-            if story and any(closing in str(story[-2]) for closing in ['Sincerely', 'Best regards', 'Thank you', 'Regards']):
-                story.append(Paragraph(stripped, styles['body']))
-                continue
-
-            # Regular body paragraph text
-            # Accumulate lines into paragraphs
-            paragraph_buffer.append(stripped)
+            if greeting_idx < line_count:
+                story.append(Spacer(1, _GAP_GREETING))
+                story.append(Paragraph(lines[greeting_idx], styles['body']))
+                story.append(Spacer(1, _GAP_PARAGRAPH))
+                add_body(greeting_idx + 1, line_count)
 
         # Flush any remaining paragraph
         if paragraph_buffer:
-            para_text = ' '.join(paragraph_buffer)
-            story.append(Paragraph(para_text, styles['body']))
+            flush_paragraph()
+
+        return story
 
-        # Build PDF
+    def _write_pdf(self, story, output_path):
+        """Build the PDF at output_path, returning the path or None on failure"""
         try:
-            doc.build(story)
+            # Build in memory and write the file once; a failed build
+            # leaves no partial PDF behind
+            buffer = io.BytesIO()
+            _LetterTemplate(buffer).build(story)
+            output_path.write_bytes(buffer.getvalue())
             print(f"✓ Cover letter PDF generated: {output_path}")
             return str(output_path)
         except Exception as e:
             print(f"Error generating cover letter PDF: {e}")
             return None
 
-    def _create_styles(self):
-        """Create custom styles for professional business letter"""
-        styles = getSampleStyleSheet()
-
-        # Header style (sender contact info)
-        styles.add(ParagraphStyle(
-            name='header',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=14,
-            alignment=TA_LEFT,
-            spaceAfter=2,
-            textColor=HexColor('#000000')
-        ))
-
-        # Body style (all letter content)
-        styles.add(ParagraphStyle(
-            name='body',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=16,
-            alignment=TA_LEFT,
-            textColor=HexColor('#000000'),
-            spaceAfter=0
-        ))
-
-        return styles
-
     def _format_contact_line(self, line):
         """Format contact line with clickable links"""
         # Add hyperlinks for LinkedIn, GitHub, Portfolio
-        formatted = line
-
-        # LinkedIn
-        if 'linkedin.com/in/' in formatted.lower():
-            formatted = re.sub(
-                r'(linkedin\.com/in/[\w-]+)',
-                r'<link href="https://\1" color="blue"><u>LinkedIn</u></link>',
-                formatted,
-                flags=re.IGNORECASE
-            )
-        elif 'LinkedIn' in formatted and 'linkedin.com/in/' not in formatted.lower():
-            # If just the word LinkedIn without URL
-            formatted = formatted.replace(
-                'LinkedIn',
-                '<link href="https://linkedin.com/in/naga-venkata-sai-chennu" color="blue"><u>LinkedIn</u></link>'
-            )
-
-        # GitHub
-        if 'github.com/' in formatted.lower():
-            formatted = re.sub(
-                r'(github\.com/[\w-]+)',
-                r'<link href="https://\1" color="blue"><u>GitHub</u></link>',
-                formatted,
-                flags=re.IGNORECASE
-            )
-        elif 'GitHub' in formatted and 'github.com/' not in formatted.lower():
-            formatted = formatted.replace(
-                'GitHub',
-                '<link href="https://github.com/nagavenkatasai7" color="blue"><u>GitHub</u></link>'
-            )
-
-        # Portfolio
-        if 'nagavenkatasai7.github.io' in formatted.lower():
-            formatted = re.sub(
-                r'(nagavenkatasai7\.github\.io/[\w/-]*)',
-                r'<link href="https://\1" color="blue"><u>Portfolio</u></link>',
-                formatted,
-                flags=re.IGNORECASE
-            )
-        elif 'Portfolio' in formatted:
-            formatted = formatted.replace(
-                'Portfolio',
-                '<link href="https://nagavenkatasai7.github.io/portfolio/" color="blue"><u>Portfolio</u></link>'
-            )
-
-        return formatted
+        lower = line.lower()
+        has_url = {kind for kind, marker in _CONTACT_URL_MARKERS.items() if marker in lower}
+
+        def _link(match):
+            kind = match.lastgroup
+            if kind in has_url:
+                return match.group(0)  # The URL gets the link instead
+            href = _CONTACT_DEFAULT_URLS.get(kind) or f"https://{match.group(0)}"
+            return f'<link href="{href}" color="blue"><u>{_CONTACT_LABELS[kind]}</u></link>'
+
+        return _CONTACT_RE.sub(_link, line)
 
 
 def main():
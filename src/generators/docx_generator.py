@@ -6,12 +6,53 @@ from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
 from pathlib import Path
+import copy
+import io
 import re
 
 
+# Markdown inline emphasis: group 1 is **bold**, group 2 is *italic*
+_BOLD_OR_ITALIC = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*')
+
+_PLAIN, _BOLD, _ITALIC = 0, 1, 2
+
+# Link targets for profile names in the contact line
+_PROFILE_URLS = {
+    'LinkedIn': 'https://linkedin.com/in/naga-venkata-sai-chennu',
+    'GitHub': 'https://github.com/nagavenkatasai7',
+    'Portfolio': 'https://nagavenkatasai7.github.io/portfolio/',
+}
+
+
+def _split_formatted(text):
+    """
+    Split markdown text into (segment, kind) tuples
+
+    kind is _PLAIN, _BOLD or _ITALIC. The text is scanned once; empty plain
+    segments are dropped.
+    """
+    segments = []
+    last = 0
+    for m in _BOLD_OR_ITALIC.finditer(text):
+        if m.start() > last:
+            segments.append((text[last:m.start()], _PLAIN))
+        if m.group(1) is not None:
+            segments.append((m.group(1), _BOLD))
+        else:
+            segments.append((m.group(2), _ITALIC))
+        last = m.end()
+    if last < len(text):
+        segments.append((text[last:], _PLAIN))
+    return segments
+
+
 class DOCXGenerator:
     """Generate ATS-friendly DOCX from markdown resume"""
 
+    # Document with margins and styles set up, built on first use and
+    # deep-copied for every resume
+    _TEMPLATE = None
+
     def __init__(self):
         """Initialize DOCX generator"""
         pass
@@ -28,6 +69,25 @@ class DOCXGenerator:
         Returns:
             Path to generated DOCX file
         """
+        # Start from a copy of the margin-set, styled empty document
+        if DOCXGenerator._TEMPLATE is None:
+            DOCXGenerator._TEMPLATE = self._create_template()
+        doc = copy.deepcopy(DOCXGenerator._TEMPLATE)
+
+        # Parse markdown and add to document
+        self._parse_markdown_to_docx(doc, markdown_content)
+
+        # Save document
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        output_path.write_bytes(buffer.getvalue())
+
+        return str(output_path)
+
+    def _create_template(self):
+        """Empty document with the resume margins and styles applied"""
         # Create document
         doc = Document()
 
@@ -42,15 +102,7 @@ class DOCXGenerator:
         # Setup custom styles
         self._setup_styles(doc)
 
-        # Parse markdown and add to document
-        self._parse_markdown_to_docx(doc, markdown_content)
-
-        # Save document
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(str(output_path))
-
-        return str(output_path)
+        return doc
 
     def _setup_styles(self, doc):
         """Setup custom ATS-friendly styles"""
@@ -105,36 +157,19 @@ class DOCXGenerator:
 
     def _parse_markdown_to_docx(self, doc, markdown_content):
         """Parse markdown content and add to DOCX document"""
-        lines = markdown_content.split('\n')
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        # Read line by line rather than materializing a list of lines
+        for i, raw_line in enumerate(io.StringIO(markdown_content)):
+            line = raw_line.strip()
 
             # Skip empty lines
             if not line:
-                i += 1
                 continue
 
-            # H1 - Candidate Name
-            if line.startswith('# '):
-                name = line[2:].strip()
-                p = doc.add_paragraph(name, style='Resume Name')
-                i += 1
-                continue
-
-            # H2 - Section Headers
-            if line.startswith('## '):
-                header = line[3:].strip()
-                p = doc.add_paragraph(header.upper(), style='Resume Section Header')
-                i += 1
-                continue
-
-            # H3 - Job Titles/Subsections
-            if line.startswith('### '):
-                title = line[4:].strip()
-                p = doc.add_paragraph(title, style='Resume Job Title')
-                i += 1
+            # Markdown line markers (#, ##, ###, -, •): one dict lookup
+            marker, sep, rest = line.partition(' ')
+            handler = self._MARKER_HANDLERS.get(marker) if sep else None
+            if handler:
+                handler(self, doc, rest.strip())
                 continue
 
             # Italic text (usually dates/locations)
@@ -143,107 +178,82 @@ class DOCXGenerator:
                 p = doc.add_paragraph(style='Resume Normal')
                 run = p.add_run(text)
                 run.italic = True
-                i += 1
-                continue
-
-            # Bullet points
-            if line.startswith('- ') or line.startswith('• '):
-                bullet_text = line[2:].strip()
-                p = doc.add_paragraph(style='List Bullet')
-                p.paragraph_format.left_indent = Inches(0.25)
-                self._add_formatted_text(p, bullet_text)
-                i += 1
                 continue
 
             # Pipe separator (contact info line)
             if '|' in line and i < 5:  # Contact info usually in first few lines
-                contact_line = line.replace('|', ' | ')
                 p = doc.add_paragraph(style='Resume Contact')
-                self._add_formatted_text(p, contact_line, add_hyperlinks=True)
-                i += 1
+                self._add_contact_line(p, line)
                 continue
 
             # Regular paragraph
-            if line:
-                p = doc.add_paragraph(style='Resume Normal')
-                self._add_formatted_text(p, line)
+            p = doc.add_paragraph(style='Resume Normal')
+            self._add_formatted_text(p, line)
+
+    def _add_name(self, doc, text):
+        """H1 - Candidate Name"""
+        doc.add_paragraph(text, style='Resume Name')
+
+    def _add_section_header(self, doc, text):
+        """H2 - Section Headers"""
+        doc.add_paragraph(text.upper(), style='Resume Section Header')
+
+    def _add_job_title(self, doc, text):
+        """H3 - Job Titles/Subsections"""
+        doc.add_paragraph(text, style='Resume Job Title')
+
+    def _add_bullet(self, doc, text):
+        """Bullet points"""
+        p = doc.add_paragraph(style='List Bullet')
+        p.paragraph_format.left_indent = Inches(0.25)
+        self._add_formatted_text(p, text)
+
+    # Line marker (text before the first space) -> handler for the rest
+    _MARKER_HANDLERS = {
+        '#': _add_name,
+        '##': _add_section_header,
+        '###': _add_job_title,
+        '-': _add_bullet,
+        '•': _add_bullet,
+    }
+
+    def _add_contact_line(self, paragraph, line):
+        """
+        Add a pipe-separated contact line to paragraph
 
-            i += 1
+        LinkedIn/GitHub/Portfolio segments become links; other segments
+        keep their markdown formatting.
+        """
+        for idx, segment in enumerate(part.strip() for part in line.split('|')):
+            if idx:
+                paragraph.add_run(' | ')
+            url = _PROFILE_URLS.get(segment)
+            if url:
+                self._add_hyperlink(paragraph, segment, url)
+            else:
+                self._add_formatted_text(paragraph, segment)
 
-    def _add_formatted_text(self, paragraph, text, add_hyperlinks=False):
+    def _add_formatted_text(self, paragraph, text):
         """
         Add text with markdown formatting to paragraph
 
         Handles:
         - Bold: **text**
         - Italic: *text*
-        - Links: [text](url) (if add_hyperlinks=True)
         """
-        # Handle hyperlinks in contact info
-        if add_hyperlinks:
-            # Simple hyperlink patterns for common sites
-            hyperlink_patterns = [
-                (r'LinkedIn', 'https://linkedin.com/in/naga-venkata-sai-chennu'),
-                (r'GitHub', 'https://github.com/nagavenkatasai7'),
-                (r'Portfolio', 'https://nagavenkatasai7.github.io/portfolio/'),
-            ]
-
-            for pattern, url in hyperlink_patterns:
-                if pattern in text:
-                    parts = text.split(pattern)
-                    for idx, part in enumerate(parts[:-1]):
-                        paragraph.add_run(part)
-                        self._add_hyperlink(paragraph, pattern, url)
-                    paragraph.add_run(parts[-1])
-                    return
+        # Fast path: most lines carry no emphasis markers at all
+        if '*' not in text:
+            if text:
+                paragraph.add_run(text)
+            return
 
         # Process bold and italic formatting
-        current_pos = 0
-        text_length = len(text)
-
-        while current_pos < text_length:
-            # Check for bold (**text**)
-            bold_match = re.search(r'\*\*([^*]+)\*\*', text[current_pos:])
-            # Check for italic (*text*)
-            italic_match = re.search(r'\*([^*]+)\*', text[current_pos:])
-
-            # Find the earliest match
-            next_match = None
-            match_type = None
-
-            if bold_match and italic_match:
-                if bold_match.start() < italic_match.start():
-                    next_match = bold_match
-                    match_type = 'bold'
-                else:
-                    next_match = italic_match
-                    match_type = 'italic'
-            elif bold_match:
-                next_match = bold_match
-                match_type = 'bold'
-            elif italic_match:
-                next_match = italic_match
-                match_type = 'italic'
-
-            if next_match:
-                # Add text before match
-                before_text = text[current_pos:current_pos + next_match.start()]
-                if before_text:
-                    paragraph.add_run(before_text)
-
-                # Add formatted text
-                formatted_text = next_match.group(1)
-                run = paragraph.add_run(formatted_text)
-                if match_type == 'bold':
-                    run.bold = True
-                elif match_type == 'italic':
-                    run.italic = True
-
-                current_pos += next_match.end()
-            else:
-                # No more matches, add remaining text
-                paragraph.add_run(text[current_pos:])
-                break
+        for segment, kind in _split_formatted(text):
+            run = paragraph.add_run(segment)
+            if kind == _BOLD:
+                run.bold = True
+            elif kind == _ITALIC:
+                run.italic = True
 
     def _add_hyperlink(self, paragraph, text, url):
         """
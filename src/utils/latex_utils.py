@@ -23,6 +23,10 @@ class LaTeXEscaper:
         '\\': r'\textbackslash{}',
     }
 
+    # One-pass translation table: every character is replaced at most once,
+    # so the braces in \textbackslash{} are never escaped again
+    _ESCAPE_TABLE = str.maketrans(LATEX_SPECIAL_CHARS)
+
     @classmethod
     def escape(cls, text: str) -> str:
         """
@@ -41,15 +45,7 @@ class LaTeXEscaper:
         if not isinstance(text, str):
             return str(text)
 
-        # Replace backslash first to avoid double-escaping
-        result = text.replace('\\', r'\textbackslash{}')
-
-        # Replace other special characters
-        for char, escaped in cls.LATEX_SPECIAL_CHARS.items():
-            if char != '\\':  # Already handled
-                result = result.replace(char, escaped)
-
-        return result
+        return text.translate(cls._ESCAPE_TABLE)
 
     @classmethod
     def escape_recursive(cls, data: Any) -> Any:
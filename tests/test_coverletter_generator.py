@@ -0,0 +1,59 @@
+"""
+Unit tests for cover letter prompt budgeting
+"""
+
+import unittest
+from unittest import mock
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.generators import coverletter_generator
+from src.generators.coverletter_generator import _CHARS_PER_TOKEN, _token_encoding, _truncate_tokens
+
+
+class TestTruncateTokens(unittest.TestCase):
+    """Test token-budget truncation and its character-based fallback"""
+
+    def setUp(self):
+        _token_encoding.cache_clear()
+        self.addCleanup(_token_encoding.cache_clear)
+
+    def test_fallback_when_encoding_fails_to_load(self):
+        """Test truncation falls back to characters when the encoding can't load"""
+        if not coverletter_generator.TIKTOKEN_AVAILABLE:
+            self.skipTest("tiktoken not installed")
+
+        # e.g. the BPE file can't be downloaded on an offline host
+        with mock.patch.object(
+            coverletter_generator.tiktoken, "get_encoding", side_effect=OSError("offline")
+        ):
+            text, truncated = _truncate_tokens("x" * 100, 10)
+
+        self.assertEqual(text, "x" * (10 * _CHARS_PER_TOKEN))
+        self.assertTrue(truncated)
+
+    def test_fallback_without_tiktoken(self):
+        """Test truncation falls back to characters when tiktoken is missing"""
+        with mock.patch.object(coverletter_generator, "TIKTOKEN_AVAILABLE", False):
+            self.assertEqual(_truncate_tokens("short profile", 10), ("short profile", False))
+            self.assertEqual(_truncate_tokens("y" * 50, 10), ("y" * (10 * _CHARS_PER_TOKEN), True))
+
+    def test_encoding_loaded_on_first_use(self):
+        """Test the encoding is loaded when first needed, then reused"""
+        if not coverletter_generator.TIKTOKEN_AVAILABLE:
+            self.skipTest("tiktoken not installed")
+
+        with mock.patch.object(
+            coverletter_generator.tiktoken, "get_encoding", side_effect=OSError("offline")
+        ) as get_encoding:
+            _truncate_tokens("first", 10)
+            _truncate_tokens("second", 10)
+
+        get_encoding.assert_called_once_with("cl100k_base")
+
+
+if __name__ == '__main__':
+    unittest.main()
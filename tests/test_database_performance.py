@@ -17,11 +17,13 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 import sys
+from datetime import datetime
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.database.schema_optimized import OptimizedDatabase
+from src.database.schema import Database as LegacyDatabase
 from src.database.migrations import MigrationManager
 
 
@@ -117,6 +119,14 @@ class TestDatabasePerformance:
         # Verify JOIN worked - should have company_name from job_descriptions
         assert 'company_name' in result[0]
 
+    def test_iter_all_resumes_streams_in_batches(self, populated_db):
+        """Test that iter_all_resumes yields every row across fetch batches"""
+        resumes = populated_db.iter_all_resumes(limit=150)
+
+        first = next(resumes)
+        assert 'company_name' in first
+        assert 1 + sum(1 for _ in resumes) == 150
+
     def test_no_n_plus_one_queries(self, populated_db):
         """Test that queries don't have N+1 problems"""
         # Count queries executed
@@ -385,6 +395,298 @@ class TestDatabasePerformance:
         # Database should not be excessively large
         assert db_size < 10 * 1024 * 1024, f"Database too large: {db_size / 1024 / 1024:.2f} MB"
 
+    def test_read_pool_is_query_only(self, test_db):
+        """Test that reads and writes use separate pools"""
+        assert test_db.pool_w is not test_db.pool_r
+
+        with test_db.pool_r.get_connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM job_descriptions")
+
+    def test_statistics_cache_versioned(self, test_db):
+        """Test that a write bumps the version instead of scanning the cache"""
+        assert test_db.get_statistics()['total_jobs'] == 0
+
+        test_db.insert_job_description(
+            company_name="Company",
+            job_description="Description"
+        )
+
+        assert test_db.cache.versions['job'] == 1
+        assert test_db.get_statistics()['total_jobs'] == 1
+
+    def test_version_key_read_keeps_invalidate_scanning(self, test_db):
+        """Test that reading a namespace version doesn't make it versioned"""
+        cache = test_db.cache
+        cache.set("report:1", "cached")
+        assert cache.version_key("report") == "report=0"
+
+        assert cache.invalidate("report") == 1
+        assert cache.get("report:1") is None
+        assert "report" not in cache.versions
+
+    def test_version_bumped_after_commit(self, test_db):
+        """Test that a namespace version only changes once its write commits"""
+        with pytest.raises(sqlite3.IntegrityError):
+            # No job 999, so the foreign key rejects the insert
+            test_db.insert_generated_resume(999, "Resume", "/path/resume.pdf", 80)
+        assert "resume" not in test_db.cache.versions
+
+        job_id = test_db.insert_job_description("Company", "Description")
+        test_db.insert_generated_resume(job_id, "Resume", "/path/resume.pdf", 80)
+        assert test_db.cache.versions["resume"] == 1
+
+    def test_schema_initialized_once(self, test_db, monkeypatch):
+        """Test that reopening a database skips init_database"""
+        calls = []
+        monkeypatch.setattr(
+            OptimizedDatabase, "init_database", lambda self: calls.append(self)
+        )
+
+        OptimizedDatabase(db_path=test_db.db_path)
+
+        assert calls == []
+
+    def test_keywords_after_reload_schema_flags(self, test_db):
+        """Test that keywords are indexed once the migration is picked up"""
+        assert not test_db._has_keywords_table
+
+        migrations_dir = os.path.join(os.path.dirname(__file__), '..', 'migrations')
+        MigrationManager(test_db.db_path, migrations_dir).migrate()
+        test_db.reload_schema_flags()
+
+        job_id = test_db.insert_job_description(
+            company_name="Company",
+            job_description="Description",
+            keywords=["Python", "SQL"]
+        )
+
+        with test_db.pool_r.get_connection() as conn:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM keywords WHERE job_description_id = ?",
+                (job_id,)
+            ).fetchone()[0]
+        assert count == 2
+
+    def test_duplicate_job_returns_existing_id(self, test_db):
+        """Test that re-inserting a job description returns the original row"""
+        job_id = test_db.insert_job_description(
+            company_name="Company",
+            job_description="Description " * 500
+        )
+
+        assert test_db.insert_job_description(
+            company_name="Company",
+            job_description="Description " * 500
+        ) == job_id
+        assert test_db.insert_job_description(
+            company_name="Other Company",
+            job_description="Description " * 500
+        ) != job_id
+
+    def test_regenerate_keeps_ids(self, test_db):
+        """Test that regenerating for the same job updates rows in place"""
+        job_id = test_db.insert_job_description(
+            company_name="Company",
+            job_description="Description"
+        )
+
+        resume_id = test_db.insert_generated_resume(job_id, "Resume v1", "/path/v1.pdf", 70)
+        assert test_db.insert_generated_resume(job_id, "Resume v2", "/path/v2.pdf", 85) == resume_id
+        assert test_db.get_all_resumes(limit=1)[0]['ats_score'] == 85
+
+        letter_id = test_db.insert_generated_cover_letter(job_id, "Letter v1", "/path/c1.pdf", resume_id)
+        assert test_db.insert_generated_cover_letter(job_id, "Letter v2", "/path/c2.pdf", resume_id) == letter_id
+
+
+class TestSharedDatabaseFile:
+    """Test schema.Database and OptimizedDatabase working on one file"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path of a database file created by schema.Database"""
+        path = str(tmp_path / "shared.db")
+        LegacyDatabase(path).close()
+        return path
+
+    def test_reads_compressed_content(self, db_path):
+        """Test large content written by schema.Database reads back as text"""
+        legacy = LegacyDatabase(db_path)
+        content = "- Built distributed systems in Python\n" * 200
+        job_id = legacy.insert_job_description("Company", "Description")
+        legacy.insert_generated_resume(job_id, content, "/path/resume.pdf", 80)
+        legacy.save_company_research("Company", content)
+
+        db = OptimizedDatabase(db_path)
+        assert db.get_all_resumes(limit=1)[0]['resume_content'] == content
+        assert db.get_company_research("Company") == content
+
+    def test_timestamps_match_schema_database(self, db_path):
+        """Test both layers write and read created_at in the same format"""
+        db = OptimizedDatabase(db_path)
+        job_id = db.insert_job_description("Company", "Description")
+        db.insert_generated_resume(job_id, "Resume", "/path/resume.pdf", 80)
+        db.save_company_research("Company", "Research")
+        db.save_company_research("Company", "Updated research")
+
+        with db.pool_r.get_connection() as conn:
+            stored = conn.execute("""
+                SELECT typeof(created_at) FROM job_descriptions
+                UNION SELECT typeof(created_at) FROM generated_resumes
+                UNION SELECT typeof(created_at) FROM company_research
+            """).fetchall()
+        assert [row[0] for row in stored] == ['integer']
+
+        created_at = db.get_all_resumes(limit=1)[0]['created_at']
+        assert datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S")
+        assert LegacyDatabase(db_path).get_all_resumes()[0]['created_at'] == created_at
+
+    def test_text_timestamps_converted(self, tmp_path):
+        """Test a file with ISO text timestamps is converted when opened"""
+        db_path = str(tmp_path / "text_timestamps.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE company_research (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT UNIQUE NOT NULL,
+                research_data TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO company_research (company_name, research_data, created_at) "
+            "VALUES ('Company', 'Research', '2025-01-02 03:04:05')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = OptimizedDatabase(db_path)
+
+        with db.pool_r.get_connection() as conn:
+            row = conn.execute(
+                "SELECT datetime(created_at, 'unixepoch') FROM company_research"
+            ).fetchone()
+        assert row[0] == '2025-01-02 03:04:05'
+
+    @staticmethod
+    def _create_baseline_database(db_path):
+        """Create a file with the original schema and one linked row per table"""
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE job_descriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT NOT NULL,
+                job_title TEXT,
+                job_description TEXT NOT NULL,
+                job_url TEXT,
+                keywords TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(company_name, job_description)
+            );
+            CREATE TABLE generated_resumes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_description_id INTEGER NOT NULL,
+                resume_content TEXT NOT NULL,
+                ats_score INTEGER,
+                file_path TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
+                UNIQUE(job_description_id)
+            );
+            CREATE TABLE generated_cover_letters (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_description_id INTEGER NOT NULL,
+                resume_id INTEGER,
+                cover_letter_content TEXT NOT NULL,
+                file_path TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (job_description_id) REFERENCES job_descriptions(id),
+                FOREIGN KEY (resume_id) REFERENCES generated_resumes(id),
+                UNIQUE(job_description_id)
+            );
+            CREATE TABLE resume_versions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                resume_id INTEGER NOT NULL,
+                content TEXT NOT NULL,
+                version_notes TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (resume_id) REFERENCES generated_resumes(id) ON DELETE CASCADE
+            );
+            INSERT INTO job_descriptions (company_name, job_description, created_at)
+            VALUES ('Company', 'Description', '2025-01-02 03:04:05');
+            INSERT INTO generated_resumes (job_description_id, resume_content, ats_score, file_path, created_at)
+            VALUES (1, 'Resume', 80, '/path/resume.pdf', '2025-01-02 03:04:06');
+            INSERT INTO generated_cover_letters
+                (job_description_id, resume_id, cover_letter_content, file_path, created_at)
+            VALUES (1, 1, 'Cover letter', '/path/letter.pdf', '2025-01-02 03:04:07');
+            INSERT INTO resume_versions (resume_id, content, version_notes, created_at)
+            VALUES (1, 'Resume', 'First', '2025-01-02 03:04:08');
+        """)
+        conn.close()
+
+    @pytest.mark.parametrize("first_layer", [LegacyDatabase, OptimizedDatabase])
+    def test_baseline_database_with_linked_rows(self, tmp_path, first_layer):
+        """Test a file with jobs referenced by other rows opens in both layers"""
+        db_path = str(tmp_path / "baseline.db")
+        self._create_baseline_database(db_path)
+
+        first_layer(db_path)
+        db = OptimizedDatabase(db_path)
+        legacy = LegacyDatabase(db_path)
+
+        resume = db.get_all_resumes(limit=1)[0]
+        assert resume['created_at'] == '2025-01-02 03:04:06'
+        assert legacy.check_cover_letter_exists(1)['created_at'] == '2025-01-02 03:04:07'
+        assert db.insert_job_description("Company", "Description") == 1
+
+        with db.pool_w.get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+
+    def test_job_descriptions_deduplicated_across_layers(self, tmp_path):
+        """Test both layers find a job description the other one stored"""
+        db_path = str(tmp_path / "optimized_first.db")
+        db = OptimizedDatabase(db_path)
+        legacy = LegacyDatabase(db_path)
+
+        job_id = db.insert_job_description("Company", "Description")
+        assert legacy.insert_job_description("Company", "Description") == job_id
+
+        other_id = legacy.insert_job_description("Company", "Other description")
+        assert db.insert_job_description("Company", "Other description") == other_id
+
+    def test_job_description_without_hash(self, tmp_path):
+        """Test a job description stored without a hash is found by its text"""
+        db_path = str(tmp_path / "text_unique.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE job_descriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company_name TEXT NOT NULL,
+                job_title TEXT,
+                job_description TEXT NOT NULL,
+                job_url TEXT,
+                keywords TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(company_name, job_description)
+            )
+        """)
+        conn.commit()
+
+        db = OptimizedDatabase(db_path)
+
+        # A row written by code that doesn't know about the hash column
+        conn.execute(
+            "INSERT INTO job_descriptions (company_name, job_description) "
+            "VALUES ('Company', 'Description')"
+        )
+        conn.commit()
+        job_id = conn.execute("SELECT id FROM job_descriptions").fetchone()[0]
+        conn.close()
+
+        assert db.insert_job_description("Company", "Description") == job_id
+        assert db.insert_job_description("Company", "Description") == job_id
+
 
 class TestMigrationSystem:
     """Test migration system functionality"""
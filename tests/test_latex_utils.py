@@ -0,0 +1,68 @@
+"""
+Unit tests for LaTeX escaping utilities
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.latex_utils import LaTeXEscaper
+
+
+class TestLaTeXEscaper(unittest.TestCase):
+    """Test LaTeX special character escaping"""
+
+    def test_special_characters(self):
+        """Test each special character is escaped on its own"""
+        expected = {
+            '&': r'\&',
+            '%': r'\%',
+            '$': r'\$',
+            '#': r'\#',
+            '_': r'\_',
+            '{': r'\{',
+            '}': r'\}',
+            '~': r'\textasciitilde{}',
+            '^': r'\textasciicircum{}',
+            '\\': r'\textbackslash{}',
+        }
+        for char, escaped in expected.items():
+            with self.subTest(char=char):
+                self.assertEqual(LaTeXEscaper.escape(char), escaped)
+
+    def test_backslash_braces_not_escaped_again(self):
+        """Test the braces added for a backslash are left as they are"""
+        self.assertEqual(
+            LaTeXEscaper.escape(r"C:\Users {home}"),
+            r"C:\textbackslash{}Users \{home\}"
+        )
+
+    def test_all_special_characters_in_one_string(self):
+        """Test every special character in one string is escaped once"""
+        self.assertEqual(
+            LaTeXEscaper.escape("\\&%$#_{}~^"),
+            r"\textbackslash{}\&\%\$\#\_\{\}\textasciitilde{}\textasciicircum{}"
+        )
+
+    def test_plain_text_unchanged(self):
+        """Test text without special characters is returned unchanged"""
+        self.assertEqual(LaTeXEscaper.escape("Senior Engineer, Python"), "Senior Engineer, Python")
+
+    def test_non_string(self):
+        """Test non-string values are converted to strings"""
+        self.assertEqual(LaTeXEscaper.escape(42), "42")
+
+    def test_escape_recursive(self):
+        """Test strings nested in lists and dicts are escaped"""
+        data = {'skills': ['C#', 'R&D'], 'years': 5}
+        self.assertEqual(
+            LaTeXEscaper.escape_recursive(data),
+            {'skills': [r'C\#', r'R\&D'], 'years': 5}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ Test suite for Resume Editor functionality
 import pytest
 import sys
 from pathlib import Path
+from datetime import datetime
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -211,6 +212,62 @@ Senior Software Engineer with 5+ years of experience in AI/ML and full-stack dev
         resume = db.get_resume_by_id(resume_id)
         assert resume['ats_score'] == 95
 
+    def test_fractional_ats_scores(self, db, sample_resume_content):
+        """Test scores rounded to one decimal (as ATSScorer returns) are stored"""
+        job_id = db.insert_job_description(
+            company_name="TechCorp",
+            job_description="Software Engineer position"
+        )
+        resume_id = db.insert_generated_resume(
+            job_description_id=job_id,
+            resume_content=sample_resume_content,
+            file_path="/path/to/resume.pdf",
+            ats_score=87.5
+        )
+        assert db.get_resume_by_id(resume_id)['ats_score'] == 87.5
+
+        db.update_resume_score(resume_id, 91.3)
+        assert db.get_resume_by_id(resume_id)['ats_score'] == 91.3
+
+    def test_integer_ats_score_column_migrated(self, tmp_path, sample_resume_content):
+        """Test a STRICT table declaring ats_score INTEGER is rebuilt as REAL"""
+        import sqlite3
+        from src.database.schema import SCHEMA_VERSION_UNIX_TIMESTAMPS, _TABLE_OPTIONS
+
+        if not _TABLE_OPTIONS:
+            pytest.skip("SQLite build without STRICT tables")
+
+        db_path = tmp_path / "strict_integer_score.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE generated_resumes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_description_id INTEGER NOT NULL,
+                resume_content ANY NOT NULL,
+                ats_score INTEGER,
+                file_path TEXT,
+                created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                ats_grade TEXT,
+                ats_color TEXT,
+                score_breakdown TEXT,
+                pass_probability REAL,
+                UNIQUE(job_description_id)
+            ) STRICT
+        """)
+        conn.execute(
+            "INSERT INTO generated_resumes (job_description_id, resume_content, ats_score) VALUES (1, 'x', 80)"
+        )
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION_UNIX_TIMESTAMPS}")
+        conn.commit()
+        conn.close()
+
+        db = Database(str(db_path))
+        db.update_resume_score(1, 87.5)
+
+        conn = db.get_connection()
+        assert conn.execute("SELECT ats_score FROM generated_resumes WHERE id = 1").fetchone()[0] == 87.5
+        conn.close()
+
     def test_docx_generation(self, sample_resume_content, tmp_path):
         """Test DOCX generation from markdown"""
         docx_gen = DOCXGenerator()
@@ -332,6 +389,176 @@ Senior Software Engineer with 5+ years of experience in AI/ML and full-stack dev
 
         conn.close()
 
+    def test_iter_all_resumes_streams_in_batches(self, db, sample_resume_content):
+        """Test that iter_all_resumes yields every row across fetch batches"""
+        from src.database.schema import FETCH_BATCH_SIZE
+
+        total = FETCH_BATCH_SIZE + 10
+        for i in range(total):
+            job_id = db.insert_job_description(
+                company_name=f"Company {i}",
+                job_description=f"Job description {i}"
+            )
+            db.insert_generated_resume(
+                job_description_id=job_id,
+                resume_content=sample_resume_content,
+                file_path=f"/path/to/resume_{i}.pdf"
+            )
+
+        resumes = db.iter_all_resumes()
+
+        # Generator, not a materialized list
+        assert not isinstance(resumes, list)
+
+        resumes = list(resumes)
+        assert len(resumes) == total
+        assert {'id', 'company_name', 'job_title', 'file_path', 'ats_score', 'created_at'} <= resumes[0].keys()
+
+        # get_all_resumes keeps returning a list
+        assert db.get_all_resumes() == resumes
+
+    def test_bulk_insert_apis(self, db, sample_resume_content):
+        """Test bulk inserts skip duplicate jobs and upsert resumes"""
+        jobs = [(f"Company {i}", f"Job description {i}", "Engineer", None, None) for i in range(50)]
+
+        with db.bulk():
+            assert db.insert_job_descriptions_many(jobs) == 50
+            # Re-inserting existing jobs is a no-op
+            assert db.insert_job_descriptions_many(jobs[:10]) == 0
+
+            resumes = [(i + 1, sample_resume_content, f"/path/{i}.pdf", 80) for i in range(50)]
+            assert db.insert_generated_resumes_many(resumes) == 50
+
+            # Existing resumes are updated in place
+            db.insert_generated_resumes_many([(1, "Updated", "/path/new.pdf", 95)])
+
+        resume = db.get_resume_by_id(1)
+        assert resume['resume_content'] == "Updated"
+        assert resume['ats_score'] == 95
+        assert len(db.get_all_resumes()) == 50
+
+    def test_score_breakdown_round_trip(self, db, sample_resume_content):
+        """Test the stored score breakdown reads back in full"""
+        job_id = db.insert_job_description(
+            company_name="TechCorp",
+            job_description="Software Engineer position"
+        )
+        resume_id = db.insert_generated_resume_with_score(
+            job_description_id=job_id,
+            resume_content=sample_resume_content,
+            file_path="/path/to/resume.pdf",
+            score_data={
+                'score': 85,
+                'grade': 'A',
+                'category_scores': {
+                    'content': {'score': 35, 'max': 40, 'checks': {}},
+                    'format': {'score': 27, 'max': 30, 'checks': {}},
+                    'structure': {'score': 15, 'max': 20, 'checks': {}},
+                    'compatibility': {'score': 8, 'max': 10, 'checks': {}}
+                }
+            }
+        )
+
+        assert db.get_resume_score_details(resume_id)['score_breakdown']['format']['max'] == 30
+
+        full = db.get_resume_full(resume_id)
+        assert full == {
+            **db.get_resume_by_id(resume_id),
+            **db.get_resume_score_details(resume_id)
+        }
+
+    def test_score_history_trends(self, db, sample_resume_content):
+        """Test score history includes per-company deltas and moving average"""
+        for description, score in (("Backend role", 70), ("Platform role", 80)):
+            job_id = db.insert_job_description(
+                company_name="TechCorp",
+                job_description=description
+            )
+            db.insert_generated_resume_with_score(
+                job_description_id=job_id,
+                resume_content=sample_resume_content,
+                file_path="/path/to/resume.pdf",
+                score_data={'score': score, 'grade': 'B'}
+            )
+
+        latest, first = db.get_score_history()
+
+        assert first['score_delta'] is None
+        assert latest['score_delta'] == 10
+        assert latest['score_avg_5'] == 75
+
+        # Filtering by job keeps the trend values computed over all resumes
+        assert db.get_score_history(job_description_id=job_id) == [latest]
+
+    def test_timestamps_stored_as_unix_seconds(self, db, sample_resume_content):
+        """Test created_at is stored as INTEGER and read back as text"""
+        job_id = db.insert_job_description(
+            company_name="TechCorp",
+            job_description="Software Engineer position"
+        )
+        resume_id = db.insert_generated_resume(
+            job_description_id=job_id,
+            resume_content=sample_resume_content,
+            file_path="/path/to/resume.pdf"
+        )
+
+        conn = db.get_connection()
+        stored = conn.execute(
+            "SELECT typeof(created_at) FROM generated_resumes WHERE id = ?", (resume_id,)
+        ).fetchone()[0]
+        conn.close()
+
+        assert stored == 'integer'
+        created_at = db.get_resume_by_id(resume_id)['created_at']
+        assert datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S")
+
+    def test_exists_checks_see_new_rows(self, db, sample_resume_content):
+        """Test cached existence checks are invalidated by inserts"""
+        job_id = db.insert_job_description(
+            company_name="TechCorp",
+            job_description="Software Engineer position"
+        )
+        assert db.check_resume_exists(job_id) is None
+        assert db.check_cover_letter_exists(job_id) is None
+
+        resume_id = db.insert_generated_resume(
+            job_description_id=job_id,
+            resume_content=sample_resume_content,
+            file_path="/path/to/resume.pdf"
+        )
+        db.insert_generated_cover_letter(job_id, "Dear Hiring Manager", "/path/to/letter.pdf", resume_id)
+
+        assert db.check_resume_exists(job_id)['id'] == resume_id
+        assert db.check_cover_letter_exists(job_id)['file_path'] == "/path/to/letter.pdf"
+
+    def test_large_content_round_trip(self, db):
+        """Test large content reads back unchanged, compressed or not"""
+        job_id = db.insert_job_description(
+            company_name="TechCorp",
+            job_description="Software Engineer position"
+        )
+        content = "# John Doe\n" + "- Built distributed systems in Python\n" * 200
+        resume_id = db.insert_generated_resume(
+            job_description_id=job_id,
+            resume_content=content,
+            file_path="/path/to/resume.pdf"
+        )
+        db.update_resume_content(resume_id, content + "Updated")
+
+        assert db.get_resume_by_id(resume_id)['resume_content'] == content + "Updated"
+        assert db.get_resume_versions(resume_id)[0]['content'] == content
+
+        db.save_company_research("TechCorp", content)
+        assert db.get_company_research("TechCorp") == content
+
+        assert [r['id'] for r in db.search_resumes("distributed SYSTEMS")] == [resume_id]
+        assert list(db.search_resumes("Kubernetes")) == []
+
+        # LIKE wildcards in the search text match literally
+        assert list(db.search_resumes("distributed%Python")) == []
+        assert list(db.search_resumes("in_Python")) == []
+        assert list(db.search_resumes("\\")) == []
+
 
 class TestDOCXGenerator:
     """Test cases specifically for DOCX generator"""